@@ -1,6 +1,7 @@
 """
-Plot reads in Bering Sea Ice Concentration data for monthly data 1850-2018 and
-also creates a netcdf file of the data!
+Script reads in Bering Sea Ice Concentration data for April 1850-2018 and
+creates the monthly Alaska_SIC netcdf product (or appends the newest year
+to an existing product)!
 
 Notes
 -----
@@ -12,6 +13,10 @@ Notes
 import numpy as np
 from netCDF4 import Dataset
 import datetime
+import sys
+sys.path.append('/home/zlabe/Documents/Projects/BeringSeaIce2018/Scripts/')
+import read_SeaIceAtlas as RA
+import write_AlaskaSIC as WA
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice/SIC_Alaska/' 
@@ -29,75 +34,30 @@ print('\n' '----Plotting Bering SIC - %s----' % titletime)
 ### Define years
 years = np.arange(1850,2018+1,1)
 
-### Retrieve data from historical sea ice atlas
-filename = directorydata + 'SNAP_SEA_ICE_ATLAS_APR.nc'
+### Existing product (unlimited year dimension)
+product = WA.findAlaska(directorydata,4)
 
-data = Dataset(filename)
-ice = data.variables['sic_con_pct'][:]
-lat1 = data.variables['lat'][:]    
-lon1 = data.variables['lon'][:]
-time = data.variables['time'][:]
-data.close()
-
-print('Completed: Data read!')
-
-### Retrieve ice atlas monthly data
-feb = ice[::12,:,:] # starts on mo/15/1850 to mo/15/2017
-
-### Meshgrid
-lon2,lat2 = np.meshgrid(lon1,lat1)
-
-### Read data for 2018
-filename2 = 'Alaska_SIC_Apr_2017.nc'
-data = Dataset(directorydata + filename2)
-ice18q = data.variables['sic'][:]
-ice18 = ice18q[np.newaxis,:,:]
-
-filename2 = 'Alaska_SIC_Apr_2018.nc'
-data = Dataset(directorydata + filename2)
-ice19q = data.variables['sic'][:]
-ice19 = ice19q[np.newaxis,:,:]
-
-
-### Append time series for 1850-2018
-iceallq = np.append(feb,ice18,axis=0)
-iceall = np.append(iceallq,ice19,axis=0)
-
-### Create netCDF4 file for February data
-def netcdfAlaska(lats,lons,var,years,directory):
-    print('\n>>> Using netcdfAlaska function!')
-    
-    name = 'Alaska_SIC_Apr_1850-2018.nc'
-    filename = directory + name
-    ncfile = Dataset(filename,'w',format='NETCDF4')
-    ncfile.description = 'April 1850-2018 SIC from ' \
-                        'Alaska Sea Ice Atlas'
-    
-    ### Dimensions
-    ncfile.createDimension('year',var.shape[0])
-    ncfile.createDimension('lat',var.shape[1])
-    ncfile.createDimension('lon',var.shape[2])
-    
-    ### Variables
-    years = ncfile.createVariable('years','f4',('year'))
-    latitude = ncfile.createVariable('lat','f4',('lat'))
-    longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('sic','f4',('year','lat','lon'))
+if product is None:
+    ### Retrieve data from historical sea ice atlas
+    filename = directorydata + 'SNAP_SEA_ICE_ATLAS_APR.nc'
+    lat1,lon1,iceatlas = RA.readAtlas(filename,4) # mo/15/1850 onwards
     
-    ### Units
-    varns.units = '%'
-    ncfile.title = 'SIC on AK Sea Ice Atlas Grid'
-    ncfile.instituion = 'Dept. ESS at University of California, Irvine'
-    ncfile.source = 'http://seaiceatlas.snap.uaf.edu/'
-    ncfile.references = 'see Atlas documentation for various sources'
+    print('Completed: Data read!')
     
-    ### Data
-    years[:] = years
-    latitude[:] = lats
-    longitude[:] = lons
-    varns[:] = var
+    ### Read data for 2017-2018 (OSISAF)
+    iceosi = []
+    for yr in range(2017,2018+1):
+        data = Dataset(directorydata + 'Alaska_SIC_Apr_%s.nc' % yr)
+        iceosi.append(data.variables['sic'][:])
+        data.close()
     
-    ncfile.close()
-    print('*Completed: Created netCDF4 File!')
+    ### Append time series for 1850-2018 and create the product
+    iceall = np.ma.concatenate([iceatlas,np.ma.stack(iceosi)],axis=0)
+    WA.writeAlaska(directorydata,4,years,iceall,lat1,lon1)
+else:
+    ### Append only the newest year to the product
+    data = Dataset(directorydata + 'Alaska_SIC_Apr_2018.nc')
+    icenew = data.variables['sic'][:]
+    data.close()
     
-netcdfAlaska(lat1,lon1,iceall,years,directorydata)
+    WA.writeAlaska(directorydata,4,years[-1],icenew,None,None)
@@ -12,6 +12,10 @@ import numpy as np
 from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 import datetime
+import sys
+sys.path.append('/home/zlabe/Documents/Projects/BeringSeaIce2018/Scripts/')
+import calc_SeaIceExtent as CE
+import calc_GridArea as GA
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice/SIC_Alaska/' 
@@ -43,35 +47,23 @@ data.close()
 
 print('Completed: Data read!')
 
-### Meshgrid
-lon2,lat2 = np.meshgrid(lon1,lat1)
-
 ### Bering Sea Ice Mask
-latq = lat2.copy()
-latq[np.where(latq>67)] = 0.
-latq[np.where(latq>0.)] = 1
-
-### Mask values below 15%
-ice = iceold * latq
+mask = CE.regionBering(lat1,lon1,67)
 
-### Extent is a binary 0 or 1 for 15% SIC threshold
-thresh=85
-ice[np.where(ice<thresh)]=np.nan
-ice[np.where(ice>=thresh)]=1
+### Area of 0.25 grid cells (exact, cached)
+area = GA.gridArea('atlas',lat1,lon1,directorydata)
 
-### Calculate sea ice extent
-ext = np.zeros((years.shape[0]))
-valyr = np.zeros((ice.shape))
-for yr in range(years.shape[0]):
-    for i in range(lat2.shape[0]):
-        for j in range(lon2.shape[1]):
-            if ice[yr,i,j] == 1.0:
-               ### Area of 0.25 grid cell [769.3 = (111.32/4) * (110.57/4)]
-               valyr[yr,i,j] = 769.3 * np.cos(np.radians(lat2[i,j]))
-    ext[yr] = np.nansum(valyr[yr,:,:])/1e6
+### Calculate sea ice extent for 15% and 85% SIC thresholds (one scan)
+thresh = np.array([15,85])
+extall = CE.calcExtentThresholds(iceold,thresh,mask,area)
     
 ### Save sea ice extent data (yearly) from sea ice atlas
-np.savetxt(directorydata3 + 'Bering_SIE85_iceatlas_01_1850-2018.txt',ext,
-       delimiter=',',header='File contains January SIE from historical' \
-       '\n ice atlas (University of Alaska) for years' \
-       '\n 1850-2018 \n')
\ No newline at end of file
+for i in range(thresh.shape[0]):
+    if thresh[i] == 15:
+        name = 'Bering_SIE_iceatlas_01_1850-2018.txt'
+    else:
+        name = 'Bering_SIE%s_iceatlas_01_1850-2018.txt' % thresh[i]
+    np.savetxt(directorydata3 + name,extall[i],
+           delimiter=',',header='File contains January SIE from historical' \
+           '\n ice atlas (University of Alaska) for years' \
+           '\n 1850-2018 \n')
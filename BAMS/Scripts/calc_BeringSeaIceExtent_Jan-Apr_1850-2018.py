@@ -13,6 +13,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import datetime
 import scipy.stats as sts
+import sys
+sys.path.append('/home/zlabe/Documents/Projects/BeringSeaIce2018/Scripts/')
+import calc_Bootstrap as BT
 
 ### Define directories
 directorydata = '/home/zlabe/Documents/Projects/BeringSeaIce2018/BAMS/Data/'
@@ -83,4 +86,10 @@ satperiod = meanatlas[-40:]
 mask = ~np.logical_or(np.isnan(satperiod),np.isnan(meansat))
 corr,p = sts.pearsonr(satperiod[mask],meansat[mask])
 print('\n>>> Correlation between ice atlas and NSIDC is --> %s' % np.round(corr,3))
-print('\n>>> P-value between ice atlas and NSIDC is --> %s' % p)
\ No newline at end of file
+print('\n>>> P-value between ice atlas and NSIDC is --> %s' % p)
+
+### Moving-block bootstrap (autocorrelation kept within 5-year blocks)
+corr,corrs = BT.bootCorr(satperiod,meansat,10000,block=5)
+lower,upper = BT.confInterval(corrs,0.05)
+print('\n>>> 95% block bootstrap interval of the correlation --> (%s, %s)' \
+      % (np.round(lower,3),np.round(upper,3)))
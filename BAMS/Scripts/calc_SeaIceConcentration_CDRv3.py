@@ -9,12 +9,18 @@ Notes
 
 ### Import modules
 import numpy as np
-from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap
 import cmocean
 import datetime
 import math
+import sys
+sys.path.append('/home/zlabe/Documents/Projects/BeringSeaIce2018/Scripts/')
+import read_SeaIceCDR as RC
+import calc_SeaIceExtent as CE
+import calc_RegionMask as RM
+import calc_GridArea as GA
+import calc_Climatology as CL
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice/CDRv3/monthly/' 
@@ -33,47 +39,26 @@ print('\n' '----Calculating Bering SIC Anomalies - %s----' % titletime)
 years = np.arange(1979,2018+1,1)
 yearq = np.where((years >= 1981) & (years <= 2010))[0]
 months = np.arange(1,12+1,1)
-monthq = [str(item).zfill(2) for item in months]
-satellite1 = np.repeat(['n07'],103)
-satellite2 = np.repeat(['f08'],53)
-satellite3 = np.repeat(['f11'],45)
-satellite4 = np.repeat(['f13'],147)
-satellite5 = np.repeat(['f17'],132)
-satall = (satellite1,satellite2,satellite3,satellite4,satellite5)
-sat = np.concatenate(satall)
-
-### Read in all data into [years,months,lat,lon]
-count = 0
-sic = np.empty((years.shape[0],months.shape[0],448,304))
-for i in range(sic.shape[0]):
-    for j in range(sic.shape[1]):
-        count += 1
-        time = '%s%s' % (years[i],monthq[j])
-        if time == '198801':
-            none = np.empty((448,304))
-            none.fill(np.nan)
-            sic[i,j,:,:] = none
-        else:
-            filename = 'seaice_conc_monthly_nh_%s_%s_v03r01.nc' % (sat[count-1],
-                                                                     time)
-            data = Dataset(directorydata + filename)
-            sic[i,j,:,:] = data.variables['seaice_conc_monthly_cdr'][:]
-            lat = data.variables['latitude'][:]
-            lon = data.variables['longitude'][:]
-            data.close()
-        
-### Mask missing data
-sic[np.where(sic > 1)] = np.nan
-sicq = sic*100.
+
+### Read in all data into [years,months,lat,lon] as compact uint8 percent
+### (flag values and missing months are 255)
+lat,lon,sicq = RC.readCDR(directorydata,years,compact=True)
+
+### Regional extent and area for every month (Meier et al. 2007 regions)
+area = GA.gridArea('cdr')
+codes,ext,are = CE.calcRegions(sicq,RM.readMask(),area,15)
+bering = np.where(codes == RM.regions['bering'])[0][0]
+print('\n>>> Jan-Apr 2018 Bering SIE (CDRv3) is --> %s' \
+      % np.round(np.nanmean(ext[-1,:4,bering]),3))
         
-### Compute 1981-2010 climatology
-yearclimo = np.nanmean(sicq[yearq,:,:,:],axis=0)
+### Compute 1981-2010 climatology (one year at a time)
+yearclimo = CL.climoStream(sicq,yearq)
 
-### Compute anomalies 
-anom = sicq - yearclimo
+### Compute anomalies only for Jan-Apr 2018
+anom = CL.anomalyStream(sicq,yearclimo,-1,slice(0,4))
 
 ### Calculate mean Jan-Apr 2018
-winter18 = np.nanmean(anom[-1,:4,:,:],axis=0)
+winter18 = np.nanmean(anom,axis=0)
 winter18[np.isnan(winter18)] = 0.
 
 ###############################################################################
@@ -15,6 +15,10 @@ from mpl_toolkits.basemap import Basemap
 import cmocean
 import datetime
 import math
+import sys
+sys.path.append('/home/zlabe/Documents/Projects/BeringSeaIce2018/Scripts/')
+import calc_SeaIceThick_PIOMAS as CP
+import calc_Climatology as CL
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice/SIC_Alaska/BAMS/Monthly_SIC/' 
@@ -32,107 +36,15 @@ print('\n' '----Plotting Bering SIC Anomalies - %s----' % titletime)
 ### Define years
 years = np.arange(1979,2018+1,1)
 
-def readPiomas(directory,years):
-    """
-    Function reads PIOMAS binary and converts to standard numpy array.
-
-    Parameters
-    ----------
-    directory : string
-        working directory for stored PIOMAS files
-    years : integers
-        years for data files
-    threshold : float
-        mask sea ice concentration amounts < to this value
-
-    Returns
-    -------
-    lats : 2d array
-        latitudes
-    lons : 2d array
-        longitudes
-    var : 4d array [year,month,lat,lon]
-        sea ice concentration (0-1) 
-
-    Usage
-    -----
-    lats,lons,var = readPiomas(directory,years,threshold)
-    """
-    
-    print('\n>>> Using readPiomas function!')
-    
-    ### Import modules
-    import numpy as np
-    import datetime
-    
-    ### Current times
-    now = datetime.datetime.now()
-    yr = now.year
-    dy = now.day
-    
-    ### Retrieve Grid
-    grid = np.genfromtxt(directory + 'grid.txt')
-    grid = np.reshape(grid,(grid.size))  
-    
-    ### Define Lat/Lon
-    lon = grid[:grid.size//2]   
-    lons = np.reshape(lon,(120,360))
-    lat = grid[grid.size//2:]
-    lats = np.reshape(lat,(120,360))
-    
-    ### Call variables from PIOMAS
-    files = 'area'
-    
-    ### Read data from binary into numpy arrays
-    var = np.empty((len(years),12,120,360))
-    
-    print('Currently reading PIOMAS data!')
-    for i in range(len(years)):
-        data = np.fromfile(directory + files + '_%s.H' % (years[i]),
-                           dtype = 'float32')
-
-    ### Reshape into [year,month,lat,lon]
-        months = data.shape[0]//(120*360)
-        if months != 12:
-            lastyearq = np.reshape(data,(months,120,360))
-            emptymo = np.empty((12-months,120,360))
-            emptymo[:,:,:] = np.nan
-            lastyear = np.append(lastyearq,emptymo,axis=0)
-            var[i,:,:,:] = lastyear
-            
-            month = datetime.date(yr, months, dy).strftime('%B')
-            print('SIC data available through ---> "%s"' % month)
-            print('SIC data available from ---> (%s - %s)' \
-                    % (np.nanmin(years),np.nanmax(years)))
-            
-        elif months == 12:
-            dataq = np.reshape(data,(12,120,360))        
-            var[i,:,:,:] = dataq
-        else:
-            ValueError('Issue with reshaping SIC array from binary')
-
-    print('Masking SIC data < %s fraction!')
-
-    print('*Completed: Read SIC data!')   
-    
-    return lats,lons,var
+### Read in sea ice concentration data (lazy float32 view)
+lats,lons,sic = CP.memmapPiomas(directorydata,years,'area',None)
 
-### Read in sea ice concentration data
-lats,lons,sic = readPiomas(directorydata,years)
-
-### Calculate anomalies for 1981-2010 baseline
+### Calculate anomalies for 1981-2010 baseline (Jan-Apr only)
 yearq = np.where((years >= 1981) & (years <= 2010))[0]
-mean = np.nanmean(sic[yearq,:,:,:],axis=0)
-anom = sic - mean
-
-### Slice months for January-April
-winterq = anom[:,:4,:,:]
-
-### Calculate for 1-100%
-winter = winterq*100
+mean = CL.climoStream(sic,yearq,slice(0,4))
 
-### Calculate for 2018
-winter18q = winter[-1,:,:,:]
+### Calculate for 1-100% for 2018
+winter18q = CL.anomalyStream(sic,mean,-1,slice(0,4))*100
 
 ### Take mean for Jan-Apr
 winter18 = np.nanmean(winter18q,axis=0)
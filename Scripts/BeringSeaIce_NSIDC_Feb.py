@@ -11,6 +11,7 @@ import numpy as np
 from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 import datetime
+import read_SeriesStore as RS
 import statsmodels.api as sm
 
 ### Define directories
@@ -31,17 +32,15 @@ years = np.arange(1850,2018+1,1)
 yearsat = np.arange(1979,2018+1,1)
 
 ### Retrieve data from NSIDC regional extent in Bering Sea
-beringoldf = np.genfromtxt(directorydata2 +'BeringSeaIce_NSIDC_Feb.txt')
-beringf = beringoldf/1e6
+store = RS.readStore(directorydata2)
+beringf = store.query('nsidc','bering','extent',2,yearsat)
 
-beringoldd = np.genfromtxt(directorydata2 +'BeringSeaIce_NSIDC_Dec.txt')
-beringd = beringoldd/1e6
+### Previous December of each winter
+beringd = store.query('nsidc','bering','extent',12,yearsat-1)
 
-beringoldj = np.genfromtxt(directorydata2 +'BeringSeaIce_NSIDC_Jan.txt')
-beringj = beringoldj/1e6
+beringj = store.query('nsidc','bering','extent',1,yearsat)
 
-#beringoldn = np.genfromtxt(directorydata2 +'BeringSeaIce_NSIDC_Nov.txt')
-#beringn = beringoldn/1e6
+#beringn = store.query('nsidc','bering','extent',11,yearsat-1)
 
 bering = (beringd + beringj + beringf)/3.
 #bering = (beringn + beringd + beringj + beringf)/4.
@@ -11,10 +11,12 @@ Date      : 2 March 2018
 import numpy as np
 import datetime
 import matplotlib.pyplot as plt
-import pandas as pd
 import cmocean
+import calc_DailySeries as DS
+import read_SeaIceIndex as RI
 
 ### Directory and time
+directorydata = '/home/zlabe/Documents/Projects/BeringSeaIce2018/Data/'
 directoryfigure = '/home/zlabe/Documents/Projects/BeringSeaIce2018/Figures/'
 now = datetime.datetime.now()
 currentmn = str(now.month)
@@ -26,33 +28,29 @@ doy = np.arange(0,365,1)
 lastday = now.timetuple().tm_yday -2
 years = np.arange(1979,2018+1,1)
 
-### Load url
-url = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/seaice_analysis/' \
-        'Sea_Ice_Index_Regional_Daily_Data_G02135_v3.0.xlsx'
+### Regional daily workbook (downloaded from
+### ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/seaice_analysis/)
+filename = directorydata + 'Sea_Ice_Index_Regional_Daily_Data_G02135_v3.0.xlsx'
 
-## Read file
-df_bering = pd.read_excel(url,sheet_name='Bering-Extent-km^2',header=1,
-                            parse_cols=range(3,43,1))
-bering = df_bering.as_matrix()
+## Read file (binary cache, rebuilt when the workbook changes)
+yearsq,month,day,bering = RI.readDaily(filename,'bering','extent')
+bering = bering[:,np.where((yearsq >= 1979) & (yearsq <= 2018))[0]]
 
 sie = bering/1e6
 print('\nCompleted: Read sea ice data!')           
 
-### Missing data in 2017
-ice17q = sie[:,-2]
-ice17q[np.where(np.isnan(ice17q))] = 5.66287231e-01
+### Fill missing days as one continuous series (e.g. 2017 gaps, Feb 29 of
+### non-leap years stays missing)
+siefill = DS.interpDaily(sie,years)
 
-### Missing data in 2018 (leap year)
-ice18q = sie[:,-1]
-ice18q[58] = (0.26670926+0.28116941)/2
-
-### Create running mean
+### Create running mean (windows continue across years)
 N = 14
+running = DS.runningDaily(siefill,N,years)
 
-meanq = np.nanmean(sie[:,:],axis=1)
-mean = np.convolve(np.append(meanq[-14:],meanq), np.ones((N,))/N, mode='valid') 
-ice17 = np.convolve(np.append(sie[-14:,-3],ice17q),np.ones((N,))/N,mode='valid') 
-ice18 = np.convolve(np.append(sie[-14:,-2],ice18q),np.ones((N,))/N,mode='valid')            
+### Daily climatology and 10-90th percentile envelope
+mean,envelope = DS.climoDaily(running,years,np.min(years),np.max(years))
+ice17 = running[:,np.where(years == 2017)[0][0]]
+ice18 = running[:,np.where(years == 2018)[0][0]]
 
 ###########################################################################
 ###########################################################################
@@ -103,6 +101,9 @@ plt.axvline(60.8,color='darkgrey',linewidth=2,zorder=1,alpha=0.3)
 plt.plot(ice17,c='w',linewidth=1.3,zorder=3,alpha=1,label=r'\textbf{Year 2017}')
 plt.plot(ice18,c='r',linewidth=3,zorder=4,alpha=1,label=r'\textbf{Year 2018}')
     
+plt.fill_between(np.arange(mean.shape[0]),envelope[0],envelope[1],
+                 color='deepskyblue',alpha=0.2,zorder=1,linewidth=0,
+                 label=r'\textbf{10-90th Percentiles}')
 plt.plot(mean,c='deepskyblue',linewidth=4,zorder=2,linestyle='--',
          label=r'\textbf{1981-2010 Mean}',dashes=(1, 0.2))
 
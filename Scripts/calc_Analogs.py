@@ -0,0 +1,176 @@
+"""
+Functions index every year of a SIC cube (e.g. one calendar month of the
+Alaska_SIC product) once and return the most similar years to a target
+field under area-weighted RMSE, pattern correlation or extent (symmetric
+difference of the ice edges) distances. The index can be compressed to its
+leading principal components and saved, so queries are a few small
+matrix-vector products.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    AnalogIndex(sic,years,area,mask,npcs,thresh)
+    loadAnalogs(filename)
+"""
+
+def _fieldsAnalog(sic,cells):
+    """
+    Function gathers the indexed cells of [field,...] as float64 (missing
+    values, including compact 255, are open water)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_CompactSIC as CS
+
+    if np.asarray(sic).dtype == np.uint8:
+        sic = CS.unpackSIC(sic,'float64')
+    else:
+        sic = np.ma.filled(np.ma.asarray(sic,dtype=float),np.nan)
+    fields = np.reshape(sic,(sic.shape[0],-1))[:,cells]
+    fields[~np.isfinite(fields)] = 0.
+    return fields
+
+class AnalogIndex(object):
+    """
+    Analog index of a [year,lat,lon] SIC cube (%). With npcs, rmse and corr
+    are calculated from the leading principal components of the anomalies.
+
+    Usage
+    -----
+    index = AnalogIndex(sic,years,area,mask,npcs,thresh)
+    analogs,distance = index.query(target,k,metric,exclude)
+    index.save(filename)
+    """
+
+    def __init__(self,sic,years,area=None,mask=None,npcs=None,thresh=15.):
+        import numpy as np
+
+        self.years = np.asarray(years)
+        self.shape = np.shape(sic)[1:]
+        self.thresh = thresh
+        if len(sic) != self.years.shape[0]:
+            raise ValueError('sic has %s years but %s years were given!' \
+                             % (len(sic),self.years.shape[0]))
+
+        ### Cells and normalized area weights of the region
+        if mask is None:
+            self.cells = np.arange(int(np.prod(self.shape)))
+        else:
+            self.cells = np.flatnonzero(np.asarray(mask))
+        if area is None:
+            self.area = np.ones(self.cells.shape)
+        else:
+            self.area = np.ravel(np.asarray(area,dtype=float))[self.cells]
+        self.weights = np.sqrt(self.area/np.sum(self.area))
+
+        fields = _fieldsAnalog(sic,self.cells)
+        self.ice = fields >= thresh
+        self.mean = np.mean(fields,axis=0)
+
+        ### Weighted anomalies (or their leading principal components)
+        anom = (fields - self.mean)*self.weights
+        if npcs is None:
+            self.components = None
+            self.scores = anom
+        else:
+            u,s,vt = np.linalg.svd(anom,full_matrices=False)
+            self.components = vt[:npcs]
+            self.scores = u[:,:npcs]*s[:npcs]
+        self.norms = np.sum(self.scores**2,axis=1)
+
+    def _project(self,target):
+        import numpy as np
+
+        field = _fieldsAnalog(np.asarray(target)[np.newaxis],self.cells)[0]
+        anom = (field - self.mean)*self.weights
+        if self.components is not None:
+            anom = np.dot(self.components,anom)
+        return field,anom
+
+    def query(self,target,k=5,metric='rmse',exclude=None):
+        """
+        Returns the k most similar years and their distances (RMSE in %,
+        1 - correlation or the extent difference in area units)
+        """
+        import numpy as np
+
+        field,anom = self._project(target)
+
+        if metric == 'rmse':
+            distance = np.sqrt(np.maximum(self.norms - 2*np.dot(self.scores,
+                                          anom) + np.sum(anom**2),0.))
+        elif metric == 'corr':
+            ### Pattern correlation of the anomalies
+            norm = np.sqrt(self.norms*np.sum(anom**2))
+            corr = np.dot(self.scores,anom)/np.where(norm > 0,norm,np.nan)
+            distance = 1. - corr
+        elif metric == 'extent':
+            ### Area of cells with ice in only one of the two fields
+            distance = np.dot(self.ice != (field >= self.thresh),self.area)
+        else:
+            raise ValueError('Unknown metric "%s", choose from ' \
+                             '[\'corr\', \'extent\', \'rmse\']' % metric)
+
+        if exclude is not None:
+            excluded = np.any(self.years == np.ravel(exclude)[:,np.newaxis],
+                              axis=0)
+            distance = np.where(excluded,np.inf,distance)
+        distance = np.where(np.isnan(distance),np.inf,distance)
+
+        order = np.argsort(distance,kind='mergesort')[:k]
+        return self.years[order],distance[order]
+
+    def save(self,filename):
+        import numpy as np
+
+        arrays = {'years' : self.years,'shape' : np.asarray(self.shape),
+                  'thresh' : self.thresh,'cells' : self.cells,
+                  'area' : self.area,'weights' : self.weights,
+                  'ice' : np.packbits(self.ice,axis=1),'mean' : self.mean,
+                  'scores' : self.scores,'norms' : self.norms}
+        if self.components is not None:
+            arrays['components'] = self.components
+        np.savez(filename,**arrays)
+
+def loadAnalogs(filename):
+    """
+    Function loads an analog index written with AnalogIndex.save
+
+    Parameters
+    ----------
+    filename : string
+        path of the .npz file
+
+    Returns
+    -------
+    index : AnalogIndex
+        analog index
+
+    Usage
+    -----
+    index = loadAnalogs(filename)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    index = AnalogIndex.__new__(AnalogIndex)
+    with np.load(filename) as data:
+        index.years = data['years']
+        index.shape = tuple(data['shape'])
+        index.thresh = float(data['thresh'])
+        for name in ['cells','area','weights','mean','scores','norms']:
+            setattr(index,name,data[name])
+        index.ice = np.unpackbits(data['ice'],
+                                  axis=1)[:,:index.cells.shape[0]].astype(bool)
+        if 'components' in data.files:
+            index.components = data['components']
+        else:
+            index.components = None
+
+    return index
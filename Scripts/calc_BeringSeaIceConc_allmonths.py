@@ -0,0 +1,33 @@
+"""
+Script rebuilds the Alaska Sea Ice Atlas SIC products for all months
+(1850-present) in one pass and creates a combined netcdf file of the data!
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+"""
+
+### Import modules
+import datetime
+import write_AlaskaSIC as WA
+
+### Define directories
+directorydata = '/surtsey/zlabe/seaice/SIC_Alaska/'
+
+### Define time
+now = datetime.datetime.now()
+currentmn = str(now.month)
+currentdy = str(now.day)
+currentyr = str(now.year)
+currenttime = currentmn + '_' + currentdy + '_' + currentyr
+titletime = currentmn + '/' + currentdy + '/' + currentyr
+print('\n' '----Building Bering SIC products - %s----' % titletime)
+
+### Define years
+yearmax = 2019
+
+### Build per-month products and [year,month,lat,lon] file
+filename = WA.buildAlaska(directorydata,yearmax)
+
+print('Completed: Script done!')
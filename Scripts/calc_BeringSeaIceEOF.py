@@ -0,0 +1,54 @@
+"""
+Script calculates the leading EOFs of Bering Sea ice concentration
+(1850-present) from the monthly Alaska Sea Ice Atlas SIC products and saves
+the modes and PCs for other analyses!
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+"""
+
+### Import modules
+import numpy as np
+from netCDF4 import Dataset
+import datetime
+import write_AlaskaSIC as WA
+import calc_SeaIceExtent as CE
+import calc_EOF as EO
+
+### Define directories
+directorydata = '/surtsey/zlabe/seaice/SIC_Alaska/'
+
+### Define time
+now = datetime.datetime.now()
+currentmn = str(now.month)
+currentdy = str(now.day)
+currentyr = str(now.year)
+currenttime = currentmn + '_' + currentdy + '_' + currentyr
+titletime = currentmn + '/' + currentdy + '/' + currentyr
+print('\n' '----Calculating Bering SIC EOFs - %s----' % titletime)
+
+### Define attributes
+months = [1,2,3,4]
+neofs = 5
+
+for month in months:
+    product = WA.findAlaska(directorydata,month)
+    if product is None:
+        raise ValueError('No Alaska_SIC product for month %s in %s' \
+                         % (month,directorydata))
+
+    ### Bering Sea mask on the atlas grid
+    data = Dataset(product)
+    lat1 = data.variables['lat'][:]
+    lon1 = data.variables['lon'][:]
+    data.close()
+    mask = CE.regionBering(lat1,lon1,67)
+
+    ### Leading modes (saved next to the product)
+    years,eofs,pcs,varfrac = EO.eofAlaska(directorydata,month,neofs,mask)
+    print('Month %s (%s-%s) variance explained ---> %s' \
+          % (month,np.min(years),np.max(years),np.round(varfrac*100,1)))
+
+print('Completed: Script done!')
@@ -0,0 +1,291 @@
+"""
+Functions estimate the uncertainty of series statistics (correlation,
+linear trend, difference of means) with a moving-block bootstrap that keeps
+the autocorrelation within blocks of years. All replicates of a chunk are
+drawn as one index matrix [replicate,year] and reduced in one batched
+pass, and chunks can be spread across a pool of worker processes.
+
+Notes
+-----
+    Reference : Wilks, D.S., 1997: Resampling hypothesis tests for
+                autocorrelated fields. J. Climate, 10, 65-82
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    blockIndex(n,block,nboot,seed)
+    bootCorr(x,y,nboot,block,seed,chunk,workers)
+    bootTrend(y,t,nboot,block,seed,chunk,workers)
+    bootMeanDiff(x,y,nboot,block,seed,chunk,workers)
+    confInterval(replicates,alpha)
+"""
+
+def blockIndex(n,block,nboot,seed=None):
+    """
+    Function draws moving-block bootstrap indices of a series
+
+    Parameters
+    ----------
+    n : integer
+        length of the series
+    block : integer
+        length of the blocks
+    nboot : integer
+        number of replicates
+    seed : integer, list or numpy RandomState, optional
+        random seed
+
+    Returns
+    -------
+    index : 2d array [replicate,n]
+        indices of the resampled series
+
+    Usage
+    -----
+    index = blockIndex(n,block,nboot,seed)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if isinstance(seed,np.random.RandomState):
+        rng = seed
+    else:
+        rng = np.random.RandomState(seed)
+    block = int(min(max(block,1),n))
+    nblocks = -(-n//block)
+
+    ### Random block starts joined end to end and cut to n
+    starts = rng.randint(0,n-block+1,(nboot,nblocks))
+    index = starts[:,:,np.newaxis] + np.arange(block)
+    return np.reshape(index,(nboot,nblocks*block))[:,:n]
+
+def _statCorr(xs,ys):
+    import numpy as np
+    xa = xs - np.mean(xs,axis=1,keepdims=True)
+    ya = ys - np.mean(ys,axis=1,keepdims=True)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        return np.sum(xa*ya,axis=1)/np.sqrt(np.sum(xa**2,axis=1) * \
+                                            np.sum(ya**2,axis=1))
+
+def _statTrend(ts,ys):
+    import numpy as np
+    ta = ts - np.mean(ts,axis=1,keepdims=True)
+    ya = ys - np.mean(ys,axis=1,keepdims=True)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        return np.sum(ta*ya,axis=1)/np.sum(ta**2,axis=1)
+
+def _statMeanDiff(xs,ys):
+    import numpy as np
+    return np.mean(xs,axis=1) - np.mean(ys,axis=1)
+
+_stats = {'corr' : _statCorr,
+          'trend' : _statTrend,
+          'meandiff' : _statMeanDiff}
+
+def _replicatesChunk(args):
+    """
+    Function calculates the replicates of one chunk (used by workers)
+    """
+
+    stat,series,paired,block,nboot,seed = args
+
+    ### Paired series share one index matrix
+    if paired:
+        index = blockIndex(series[0].shape[0],block,nboot,seed)
+        samples = [var[index] for var in series]
+    else:
+        samples = [var[blockIndex(var.shape[0],block,nboot,seed)] \
+                   for var in series]
+    return _stats[stat](*samples)
+
+def _bootstrap(stat,series,paired,nboot,block,seed,chunk,workers):
+    """
+    Function draws nboot replicates of a statistic in chunks (optionally in
+    parallel, results do not depend on the number of workers)
+    """
+
+    ### Import modules
+    import numpy as np
+    from concurrent.futures import ProcessPoolExecutor
+
+    if block is None:
+        ### Rule of thumb block length n^(1/3)
+        block = int(np.round(min([var.shape[0] for var in series])**(1/3.)))
+
+    ### Independent random streams per chunk (seeded by [seed,chunk])
+    sizes = [min(chunk,nboot-i) for i in range(0,nboot,chunk)]
+    seeds = [None if seed is None else [seed,i] for i in range(len(sizes))]
+    args = [(stat,series,paired,block,size,sq) \
+            for size,sq in zip(sizes,seeds)]
+
+    if workers is None or workers == 1:
+        replicates = [_replicatesChunk(arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            replicates = list(pool.map(_replicatesChunk,args))
+
+    estimate = _stats[stat](*[var[np.newaxis] for var in series])[0]
+    return estimate,np.concatenate(replicates)
+
+def _pairedSeries(x,y):
+    """
+    Function drops the years where either series is missing
+    """
+    import numpy as np
+    x = np.ma.filled(np.ma.asarray(x,dtype=float),np.nan)
+    y = np.ma.filled(np.ma.asarray(y,dtype=float),np.nan)
+    if x.shape != y.shape:
+        raise ValueError('Series have different lengths (%s and %s)!' \
+                         % (x.shape[0],y.shape[0]))
+    valid = np.isfinite(x) & np.isfinite(y)
+    return x[valid],y[valid]
+
+def bootCorr(x,y,nboot=10000,block=None,seed=0,chunk=2000,workers=None):
+    """
+    Function calculates moving-block bootstrap replicates of the Pearson
+    correlation of two paired series (years missing in either are dropped)
+
+    Parameters
+    ----------
+    x,y : 1d arrays [year]
+        paired series
+    nboot : integer, optional
+        number of replicates
+    block : integer, optional
+        block length (years), default is n^(1/3)
+    seed : integer, optional
+        random seed
+    chunk : integer, optional
+        replicates per index matrix
+    workers : integer, optional
+        number of worker processes (default is serial)
+
+    Returns
+    -------
+    corr : float
+        correlation of the series
+    replicates : 1d array [replicate]
+        bootstrap correlations
+
+    Usage
+    -----
+    corr,replicates = bootCorr(x,y,nboot,block,seed,chunk,workers)
+    """
+
+    x,y = _pairedSeries(x,y)
+    return _bootstrap('corr',[x,y],True,nboot,block,seed,chunk,workers)
+
+def bootTrend(y,t=None,nboot=10000,block=None,seed=0,chunk=2000,
+              workers=None):
+    """
+    Function calculates moving-block bootstrap replicates of the linear
+    trend (least squares slope) of a series
+
+    Parameters
+    ----------
+    y : 1d array [year]
+        series
+    t : 1d array [year], optional
+        time of each value (default is 0,1,2,... so per year)
+    nboot : integer, optional
+        number of replicates
+    block : integer, optional
+        block length (years), default is n^(1/3)
+    seed : integer, optional
+        random seed
+    chunk : integer, optional
+        replicates per index matrix
+    workers : integer, optional
+        number of worker processes (default is serial)
+
+    Returns
+    -------
+    trend : float
+        slope of the series (units per unit of t)
+    replicates : 1d array [replicate]
+        bootstrap slopes
+
+    Usage
+    -----
+    trend,replicates = bootTrend(y,t,nboot,block,seed,chunk,workers)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if t is None:
+        t = np.arange(np.shape(y)[0])
+    t,y = _pairedSeries(t,y)
+    return _bootstrap('trend',[t,y],True,nboot,block,seed,chunk,workers)
+
+def bootMeanDiff(x,y,nboot=10000,block=None,seed=0,chunk=2000,
+                 workers=None):
+    """
+    Function calculates moving-block bootstrap replicates of the difference
+    of means of two series (resampled independently, nan are dropped)
+
+    Parameters
+    ----------
+    x,y : 1d arrays
+        series (lengths may differ)
+    nboot : integer, optional
+        number of replicates
+    block : integer, optional
+        block length (years), default is n^(1/3)
+    seed : integer, optional
+        random seed
+    chunk : integer, optional
+        replicates per index matrix
+    workers : integer, optional
+        number of worker processes (default is serial)
+
+    Returns
+    -------
+    diff : float
+        mean of x minus mean of y
+    replicates : 1d array [replicate]
+        bootstrap differences
+
+    Usage
+    -----
+    diff,replicates = bootMeanDiff(x,y,nboot,block,seed,chunk,workers)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    x = np.ma.filled(np.ma.asarray(x,dtype=float),np.nan)
+    y = np.ma.filled(np.ma.asarray(y,dtype=float),np.nan)
+    x = x[np.isfinite(x)]
+    y = y[np.isfinite(y)]
+    return _bootstrap('meandiff',[x,y],False,nboot,block,seed,chunk,workers)
+
+def confInterval(replicates,alpha=0.05):
+    """
+    Function calculates the percentile confidence interval of replicates
+
+    Parameters
+    ----------
+    replicates : 1d array [replicate]
+        bootstrap replicates
+    alpha : float, optional
+        1 - confidence level
+
+    Returns
+    -------
+    lower,upper : floats
+        bounds of the interval
+
+    Usage
+    -----
+    lower,upper = confInterval(replicates,alpha)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    lower,upper = np.nanpercentile(replicates,[100*alpha/2.,
+                                               100*(1-alpha/2.)])
+    return lower,upper
@@ -0,0 +1,294 @@
+"""
+Functions calculate climatologies incrementally (one year of data at a time,
+nan-aware, Welford updates when the variance is wanted) and hand out
+anomalies only for the requested year/month slices, so peak memory is the
+climatology plus the requested slices. YearIndex keeps prefix sums over the
+year axis so the mean of any baseline window needs no re-scan of the data.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    Climatology(variance)
+    climoStream(var,yearq,months,variance)
+    anomalyStream(var,climo,yearq,months)
+    YearIndex(var,years,squares)
+"""
+
+def _fieldClimo(field):
+    """
+    Function promotes one field to float64 with nan as missing (masked and
+    compact uint8 fields are supported)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_CompactSIC as CS
+
+    if np.asarray(field).dtype == np.uint8:
+        return CS.unpackSIC(field,'float64')
+    return np.ma.filled(np.ma.asarray(field,dtype=float),np.nan)
+
+class Climatology(object):
+    """
+    Running nan-aware climatology of fields [month,...] added one year at a
+    time (means from sums and counts, or Welford updates for the variance)
+
+    Usage
+    -----
+    climo = Climatology(variance)
+    climo.add(field)
+    mean = climo.mean
+    anom = climo.anomaly(field,months)
+    """
+
+    def __init__(self,variance=False):
+        self.variance = variance
+        self.months = None
+        self.count = None
+        self.total = None
+        self.average = None
+        self.m2 = None
+
+    def add(self,field):
+        import numpy as np
+
+        field = _fieldClimo(field)
+        valid = np.isfinite(field)
+        if self.count is None:
+            self.count = np.zeros(field.shape,dtype='int32')
+            if self.variance:
+                self.average = np.zeros(field.shape)
+                self.m2 = np.zeros(field.shape)
+            else:
+                self.total = np.zeros(field.shape)
+
+        self.count += valid
+        if self.variance:
+            ### Welford update for valid cells only
+            delta = np.where(valid,field - self.average,0.)
+            self.average += np.divide(delta,self.count,
+                                      out=np.zeros(field.shape),
+                                      where=self.count > 0)
+            self.m2 += np.where(valid,delta*(field - self.average),0.)
+        else:
+            self.total += np.where(valid,field,0.)
+
+    @property
+    def mean(self):
+        import numpy as np
+
+        if self.variance:
+            mean = self.average.copy()
+        else:
+            mean = np.divide(self.total,self.count,
+                             out=np.zeros(self.total.shape),
+                             where=self.count > 0)
+        mean[self.count == 0] = np.nan
+        return mean
+
+    @property
+    def var(self):
+        import numpy as np
+
+        if not self.variance:
+            raise ValueError('Climatology was built without variance=True!')
+        var = np.divide(self.m2,self.count - 1,out=np.zeros(self.m2.shape),
+                        where=self.count > 1)
+        var[self.count < 2] = np.nan
+        return var
+
+    def anomaly(self,field,months=None):
+        """
+        Returns field minus the climatology (months are positions along the
+        month axis of the climatology, default is all)
+        """
+        field = _fieldClimo(field)
+        mean = self.mean if months is None else self.mean[months]
+        return field - mean
+
+    def positions(self,months):
+        """
+        Returns the positions in the climatology of calendar month indices
+        of the source (climatologies from climoStream store their months)
+        """
+        import numpy as np
+
+        if self.months is None:
+            return months
+        lookup = dict(zip(self.months.tolist(),range(self.months.shape[0])))
+        missing = [mo for mo in np.ravel(months).tolist() if mo not in lookup]
+        if missing:
+            raise ValueError('Months %s are not in the climatology %s!' \
+                             % (missing,self.months.tolist()))
+        return np.array([lookup[mo] for mo in np.ravel(months).tolist()])
+
+def climoStream(var,yearq,months=None,variance=False):
+    """
+    Function builds a climatology by reading one year of data at a time
+
+    Parameters
+    ----------
+    var : 4d array [year,month,lat,lon]
+        any indexable source (numpy array, netCDF4 variable, PiomasView)
+    yearq : 1d array
+        indices of the baseline years
+    months : slice or 1d array, optional
+        months to include (default is all)
+    variance : boolean, optional
+        also track the variance (Welford)
+
+    Returns
+    -------
+    climo : Climatology
+        running climatology [month,lat,lon] of the baseline years (the
+        source month indices are kept in climo.months)
+
+    Usage
+    -----
+    climo = climoStream(var,yearq,months,variance)
+    """
+
+    print('\n>>> Using climoStream function!')
+
+    ### Import modules
+    import numpy as np
+
+    if months is None:
+        months = slice(None)
+
+    climo = Climatology(variance)
+    climo.months = np.arange(np.shape(var)[1])[months]
+    for yr in yearq:
+        climo.add(var[yr,months])
+
+    print('*Completed: Climatology calculated over %s years!' % len(yearq))
+    return climo
+
+def anomalyStream(var,climo,yearq,months=None):
+    """
+    Function calculates anomalies only for the requested years/months
+
+    Parameters
+    ----------
+    var : 4d array [year,month,lat,lon]
+        any indexable source (numpy array, netCDF4 variable, PiomasView)
+    climo : Climatology
+        climatology [month,lat,lon] covering the requested months
+    yearq : integer or 1d array
+        index (or indices) of the requested years
+    months : slice or 1d array, optional
+        month indices of var (default is the months of climo)
+
+    Returns
+    -------
+    anom : 3d array [month,lat,lon] or 4d array [year,month,lat,lon]
+        anomalies of the requested slices
+
+    Usage
+    -----
+    anom = anomalyStream(var,climo,yearq,months)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if months is None:
+        months = slice(None) if climo.months is None else climo.months
+
+    ### Positions of the requested months in the climatology
+    if climo.months is None:
+        positions = months
+    else:
+        positions = climo.positions(np.arange(np.shape(var)[1])[months])
+
+    if np.ndim(yearq) == 0:
+        return climo.anomaly(var[yearq,months],positions)
+    return np.stack([climo.anomaly(var[yr,months],positions) \
+                     for yr in yearq])
+
+class YearIndex(object):
+    """
+    Prefix sums (and counts) of a series or gridded field over the year
+    axis, so the nan-aware mean (or variance) of any [yearmin,yearmax]
+    window is two subtractions per grid cell without re-reading the data
+
+    Usage
+    -----
+    index = YearIndex(var,years,squares)
+    mean = index.mean(yearmin,yearmax)
+    var = index.var(yearmin,yearmax)
+    yearq = index.window(yearmin,yearmax)
+    """
+
+    def __init__(self,var,years,squares=False):
+        import numpy as np
+
+        self.years = np.asarray(years)
+        if len(var) != self.years.shape[0]:
+            raise ValueError('var has %s years but %s years were given!' \
+                             % (len(var),self.years.shape[0]))
+        self.squares = squares
+
+        ### Cumulative sums built one year at a time (row 0 is zero)
+        for i in range(self.years.shape[0]):
+            field = _fieldClimo(var[i])
+            valid = np.isfinite(field)
+            if i == 0:
+                shape = (self.years.shape[0]+1,) + field.shape
+                self.total = np.zeros(shape)
+                self.count = np.zeros(shape,dtype='int32')
+                ### Shift by the first field for stable sums of squares
+                self.shift = np.where(valid,field,0.)
+                if squares:
+                    self.total2 = np.zeros(shape)
+            value = np.where(valid,field - self.shift,0.)
+            self.total[i+1] = self.total[i] + value
+            self.count[i+1] = self.count[i] + valid
+            if squares:
+                self.total2[i+1] = self.total2[i] + value**2
+
+    def _window(self,yearmin,yearmax):
+        import numpy as np
+
+        start = np.searchsorted(self.years,yearmin,side='left')
+        stop = np.searchsorted(self.years,yearmax,side='right')
+        return start,stop
+
+    def window(self,yearmin,yearmax):
+        """
+        Returns the slice of the year axis of [yearmin,yearmax]
+        """
+        return slice(*self._window(yearmin,yearmax))
+
+    def n(self,yearmin,yearmax):
+        start,stop = self._window(yearmin,yearmax)
+        return self.count[stop] - self.count[start]
+
+    def mean(self,yearmin,yearmax):
+        import numpy as np
+
+        start,stop = self._window(yearmin,yearmax)
+        count = self.count[stop] - self.count[start]
+        total = self.total[stop] - self.total[start]
+        mean = np.divide(total,count,out=np.zeros(total.shape),
+                         where=count > 0) + self.shift
+        return np.where(count > 0,mean,np.nan)
+
+    def var(self,yearmin,yearmax,ddof=1):
+        import numpy as np
+
+        if not self.squares:
+            raise ValueError('YearIndex was built without squares=True!')
+        start,stop = self._window(yearmin,yearmax)
+        count = self.count[stop] - self.count[start]
+        total = self.total[stop] - self.total[start]
+        total2 = self.total2[stop] - self.total2[start]
+        ss = total2 - np.divide(total**2,count,out=np.zeros(total.shape),
+                                where=count > 0)
+        var = np.divide(np.maximum(ss,0.),count - ddof,
+                        out=np.zeros(total.shape),where=count > ddof)
+        return np.where(count > ddof,var,np.nan)
@@ -0,0 +1,123 @@
+"""
+Functions convert sea ice concentration to a compact uint8 form (integer
+percent 0-100, 255 for missing/flag values) and reduce it without
+promoting whole cubes to float. A uint8 cube is 4x smaller than float32
+and 8x smaller than float64 in memory and on disk.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    packSIC(sic,scale)
+    unpackSIC(sicu,dtype)
+    meanSIC(sicu,chunk)
+"""
+
+### Value of missing data (land, flags, masked or nan) in compact SIC
+missing = 255
+
+def packSIC(sic,scale=1.):
+    """
+    Function converts sea ice concentration to compact uint8 percent
+
+    Parameters
+    ----------
+    sic : nd array
+        sea ice concentration, masked arrays are supported
+    scale : float, optional
+        factor to convert sic to percent (e.g. 100 for fractions)
+
+    Returns
+    -------
+    sicu : nd array
+        sea ice concentration (%) as uint8, missing (nan, masked or out of
+        0-100% such as the CDR flag values) is 255
+
+    Usage
+    -----
+    sicu = packSIC(sic,scale)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    sic = np.ma.filled(np.ma.asarray(sic,dtype='float32'),np.nan)
+    if scale != 1.:
+        sic = sic*scale
+    sicr = np.rint(sic)
+    valid = (sicr >= 0) & (sicr <= 100)
+
+    sicu = np.full(sic.shape,missing,dtype='uint8')
+    sicu[valid] = sicr[valid]
+
+    return sicu
+
+def unpackSIC(sicu,dtype='float32'):
+    """
+    Function converts compact uint8 SIC back to float with nan as missing
+
+    Parameters
+    ----------
+    sicu : nd array
+        compact sea ice concentration (%)
+    dtype : string, optional
+        float type of the output
+
+    Returns
+    -------
+    sic : nd array
+        sea ice concentration (%)
+
+    Usage
+    -----
+    sic = unpackSIC(sicu,dtype)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    sicu = np.asarray(sicu)
+    sic = sicu.astype(dtype)
+    sic[sicu == missing] = np.nan
+
+    return sic
+
+def meanSIC(sicu,chunk=24):
+    """
+    Function averages compact SIC over the leading axis (missing values are
+    ignored) with integer sums over chunks of fields
+
+    Parameters
+    ----------
+    sicu : nd array [time,...]
+        compact sea ice concentration (%)
+    chunk : integer, optional
+        number of fields summed at once
+
+    Returns
+    -------
+    mean : nd array [...]
+        mean sea ice concentration (%), nan where all fields are missing
+
+    Usage
+    -----
+    mean = meanSIC(sicu,chunk)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    total = np.zeros(np.shape(sicu)[1:],dtype='int64')
+    count = np.zeros(np.shape(sicu)[1:],dtype='int64')
+    for t in range(0,np.shape(sicu)[0],chunk):
+        sicq = np.asarray(sicu[t:t+chunk])
+        valid = sicq != missing
+        total += np.sum(np.where(valid,sicq,0),axis=0,dtype='int64')
+        count += np.sum(valid,axis=0)
+
+    mean = np.full(total.shape,np.nan)
+    np.divide(total,count,out=mean,where=count > 0)
+    return mean
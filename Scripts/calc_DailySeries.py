@@ -0,0 +1,164 @@
+"""
+Functions treat a daily regional sea ice record [doy,year] (e.g. the Sea Ice
+Index regional daily workbook) as one continuous series across year
+boundaries, so gap filling, running means and the daily climatology are
+calculated for every year at once. Adding a year is adding a column. With
+the years of a 366-day record, the Feb 29 row of non-leap years is left out
+of the series and stays nan.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    interpDaily(sie,years)
+    runningDaily(sie,N,years)
+    climoDaily(sie,years,yearmin,yearmax,percentiles)
+"""
+
+def _calendarDaily(sie,years):
+    """
+    Function flattens [doy,year] to the continuous series of calendar days
+    (the Feb 29 row of non-leap years is dropped from a 366-day record)
+    and returns the series with the flat positions of its days
+    """
+
+    ### Import modules
+    import numpy as np
+    import calendar as cal
+
+    sie = np.asarray(sie,dtype=float)
+    real = np.ones(sie.shape,dtype=bool)
+    if years is not None and sie.shape[0] == 366:
+        real[59,:] = [cal.isleap(yr) for yr in years]
+    days = np.flatnonzero(np.ravel(real,order='F'))
+    return np.ravel(sie,order='F')[days],days
+
+def _gridDaily(series,days,shape):
+    """
+    Function puts the continuous series back on the [doy,year] grid (rows
+    that are not calendar days are nan)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    grid = np.full(int(np.prod(shape)),np.nan)
+    grid[days] = series
+    return np.reshape(grid,shape,order='F')
+
+def interpDaily(sie,years=None):
+    """
+    Function linearly interpolates nan gaps of the continuous daily series.
+    Days before the first and after the last valid value (e.g. the rest of
+    the current year) are left as nan.
+
+    Parameters
+    ----------
+    sie : 2d array [doy,year]
+        daily sea ice extent (or area)
+    years : 1d array, optional
+        years of the columns (Feb 29 of non-leap years is not filled)
+
+    Returns
+    -------
+    siefill : 2d array [doy,year]
+        daily series with interior gaps filled
+
+    Usage
+    -----
+    siefill = interpDaily(sie,years)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    ### Continuous series (year after year)
+    series,days = _calendarDaily(sie,years)
+    valid = np.flatnonzero(np.isfinite(series))
+
+    siefill = np.full(series.shape,np.nan)
+    if valid.size > 0:
+        gaps = np.arange(valid[0],valid[-1]+1)
+        siefill[gaps] = np.interp(gaps,valid,series[valid])
+
+    return _gridDaily(siefill,days,np.shape(sie))
+
+def runningDaily(sie,N=14,years=None):
+    """
+    Function calculates the trailing N-day running mean of the continuous
+    daily series (windows reach back into the previous year)
+
+    Parameters
+    ----------
+    sie : 2d array [doy,year]
+        daily sea ice extent (gaps already filled, see interpDaily)
+    N : integer, optional
+        length of the running mean (days)
+    years : 1d array, optional
+        years of the columns (Feb 29 of non-leap years is not a day)
+
+    Returns
+    -------
+    running : 2d array [doy,year]
+        running mean ending on each day (nan if the window has missing days)
+
+    Usage
+    -----
+    running = runningDaily(sie,N,years)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    series,days = _calendarDaily(sie,years)
+    valid = np.isfinite(series)
+
+    ### Window sums from cumulative sums of values and valid days
+    total = np.concatenate([[0.],np.cumsum(np.where(valid,series,0.))])
+    count = np.concatenate([[0],np.cumsum(valid)])
+    running = np.full(series.shape,np.nan)
+    running[N-1:] = (total[N:] - total[:-N])/N
+    running[N-1:][(count[N:] - count[:-N]) < N] = np.nan
+
+    return _gridDaily(running,days,np.shape(sie))
+
+def climoDaily(sie,years,yearmin,yearmax,percentiles=(10,90)):
+    """
+    Function calculates the daily climatology and percentile envelope
+
+    Parameters
+    ----------
+    sie : 2d array [doy,year]
+        daily sea ice extent (e.g. running means from runningDaily)
+    years : 1d array
+        years of the columns of sie
+    yearmin,yearmax : integers
+        bounds of the climatology (inclusive)
+    percentiles : sequence of floats, optional
+        percentiles of the envelope
+
+    Returns
+    -------
+    mean : 1d array [doy]
+        daily mean over the climatology years
+    envelope : 2d array [percentile,doy]
+        daily percentiles over the climatology years
+
+    Usage
+    -----
+    mean,envelope = climoDaily(sie,years,yearmin,yearmax,percentiles)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    yearq = np.where((years >= yearmin) & (years <= yearmax))[0]
+    siebase = np.asarray(sie,dtype=float)[:,yearq]
+
+    mean = np.nanmean(siebase,axis=1)
+    envelope = np.nanpercentile(siebase,percentiles,axis=1)
+
+    return mean,envelope
@@ -0,0 +1,272 @@
+"""
+Functions calculate the leading EOFs/PCs of a SIC cube with a randomized
+SVD of the area-weighted anomaly matrix [year,cell]. The matrix is never
+formed: every pass streams chunks of years from the source (e.g. a netCDF
+variable of an Alaska_SIC product), so memory is bounded by a chunk of years
+and run time scales linearly with the record length.
+
+Notes
+-----
+    Reference : Halko, N., P.G. Martinsson, and J.A. Tropp, 2011: Finding
+                structure with randomness. SIAM Review, 53, 217-288
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    eofStream(var,area,mask,neofs,month,oversample,iters,chunk,seed)
+    eofAlaska(directory,month,neofs,mask,filename)
+    loadEOF(filename)
+"""
+
+def _chunksEOF(var,cells,month,chunk):
+    """
+    Function yields (start,fields [year,cell]) for chunks of years (missing
+    values, including compact 255, are nan)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_CompactSIC as CS
+
+    for t in range(0,len(var),chunk):
+        if month is None:
+            ice = var[t:t+chunk]
+        else:
+            ice = var[t:t+chunk,month]
+        if np.asarray(ice).dtype == np.uint8:
+            ice = CS.unpackSIC(ice,'float64')
+        else:
+            ice = np.ma.filled(np.ma.asarray(ice,dtype=float),np.nan)
+        yield t,np.reshape(ice,(ice.shape[0],-1))[:,cells]
+
+def eofStream(var,area=None,mask=None,neofs=5,month=None,oversample=10,
+              iters=2,chunk=24,seed=0):
+    """
+    Function calculates the leading EOFs of a [year,...,lat,lon] source with
+    a randomized SVD that reads chunks of years in every pass
+
+    Parameters
+    ----------
+    var : 3d array [year,lat,lon] or 4d array [year,month,lat,lon]
+        sea ice concentration, any indexable source (numpy array, netCDF4
+        variable, PiomasView)
+    area : 2d array [lat,lon], optional
+        area of each grid cell (anomalies are weighted by sqrt(area))
+    mask : 2d array [lat,lon], optional
+        boolean region mask (default is the full grid)
+    neofs : integer, optional
+        number of modes (at most the number of years or cells)
+    month : integer, optional
+        index of the month of a 4d source
+    oversample : integer, optional
+        extra random vectors of the sketch
+    iters : integer, optional
+        number of power iterations
+    chunk : integer, optional
+        number of years read at once
+    seed : integer, optional
+        seed of the random sketch
+
+    Returns
+    -------
+    eofs : 3d array [mode,lat,lon]
+        spatial patterns (nan outside the mask)
+    pcs : 2d array [year,mode]
+        principal components (anomaly = pcs @ eofs)
+    varfrac : 1d array [mode]
+        fraction of the weighted variance explained by each mode
+    mean : 2d array [lat,lon]
+        climatology removed from the fields
+
+    Usage
+    -----
+    eofs,pcs,varfrac,mean = eofStream(var,area,mask,neofs,month,oversample,
+                                      iters,chunk,seed)
+    """
+
+    print('\n>>> Using eofStream function!')
+
+    ### Import modules
+    import numpy as np
+
+    shape = np.shape(var)[-2:]
+    nyears = len(var)
+    if mask is None:
+        cells = np.arange(shape[0]*shape[1])
+    else:
+        cells = np.flatnonzero(np.asarray(mask))
+    if area is None:
+        weights = np.ones(cells.shape)
+    else:
+        weights = np.sqrt(np.ravel(np.asarray(area,dtype=float))[cells])
+
+    ### At most one mode per year (or cell)
+    if neofs > min(nyears,cells.shape[0]):
+        neofs = min(nyears,cells.shape[0])
+        print('Only %s EOFs can be calculated!' % neofs)
+
+    ### Pass 1: nan-aware mean of each cell
+    total = np.zeros(cells.shape)
+    count = np.zeros(cells.shape)
+    for t,fields in _chunksEOF(var,cells,month,chunk):
+        total += np.nansum(fields,axis=0)
+        count += np.sum(np.isfinite(fields),axis=0)
+    mean = np.divide(total,count,out=np.zeros(cells.shape),where=count > 0)
+
+    def anomalies():
+        for t,fields in _chunksEOF(var,cells,month,chunk):
+            anom = (fields - mean)*weights
+            anom[~np.isfinite(anom)] = 0.
+            yield t,anom
+
+    ### Range of the anomaly matrix A from a random sketch Y = A @ omega
+    nvec = min(neofs + oversample,nyears,cells.shape[0])
+    omega = np.random.RandomState(seed).standard_normal((cells.shape[0],
+                                                         nvec))
+    y = np.zeros((nyears,nvec))
+    for t,anom in anomalies():
+        y[t:t+anom.shape[0]] = np.dot(anom,omega)
+
+    ### Power iterations Y = A @ (A.T @ Y) sharpen the leading modes
+    for i in range(iters):
+        q = np.linalg.qr(y)[0]
+        z = np.zeros((cells.shape[0],nvec))
+        for t,anom in anomalies():
+            z += np.dot(anom.T,q[t:t+anom.shape[0]])
+        z = np.linalg.qr(z)[0]
+        for t,anom in anomalies():
+            y[t:t+anom.shape[0]] = np.dot(anom,z)
+    q = np.linalg.qr(y)[0]
+
+    ### Small matrix B = Q.T @ A and the total variance
+    b = np.zeros((nvec,cells.shape[0]))
+    totalvar = 0.
+    for t,anom in anomalies():
+        b += np.dot(q[t:t+anom.shape[0]].T,anom)
+        totalvar += np.sum(anom**2)
+    ub,s,vt = np.linalg.svd(b,full_matrices=False)
+
+    ### Leading modes (sign fixed so each pattern has a positive sum)
+    sign = np.sign(np.sum(vt[:neofs]/weights,axis=1))
+    sign[sign == 0] = 1.
+    pcs = np.dot(q,ub[:,:neofs])*s[:neofs]*sign
+    patterns = vt[:neofs]/weights*sign[:,np.newaxis]
+    varfrac = s[:neofs]**2/totalvar
+
+    eofs = np.full((neofs,shape[0]*shape[1]),np.nan)
+    eofs[:,cells] = patterns
+    meangrid = np.full((shape[0]*shape[1]),np.nan)
+    meangrid[cells] = mean
+
+    print('*Completed: %s EOFs explain %s%% of the variance!' \
+          % (neofs,np.round(np.sum(varfrac)*100,1)))
+    return (np.reshape(eofs,(neofs,) + shape),pcs,varfrac,
+            np.reshape(meangrid,shape))
+
+def eofAlaska(directory,month,neofs=5,mask=None,filename=None):
+    """
+    Function calculates (or loads) the EOFs of a monthly Alaska_SIC product,
+    streaming the years from the netCDF file. Results are saved next to the
+    product and reused until the product changes.
+
+    Parameters
+    ----------
+    directory : string
+        directory of the stored Alaska_SIC products
+    month : integer
+        calendar month (1-12)
+    neofs : integer, optional
+        number of modes
+    mask : 2d array [lat,lon], optional
+        boolean region mask (default is the full grid)
+    filename : string, optional
+        path of the saved EOFs (default is EOF_<product>.npz in directory)
+
+    Returns
+    -------
+    years : 1d array [year]
+        years of the PCs
+    eofs : 3d array [mode,lat,lon]
+        spatial patterns
+    pcs : 2d array [year,mode]
+        principal components
+    varfrac : 1d array [mode]
+        fraction of the weighted variance explained by each mode
+
+    Usage
+    -----
+    years,eofs,pcs,varfrac = eofAlaska(directory,month,neofs,mask,filename)
+    """
+
+    print('\n>>> Using eofAlaska function!')
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+    import os
+    import write_AlaskaSIC as WA
+    import calc_GridArea as GA
+
+    product = WA.findAlaska(directory,month)
+    if product is None:
+        raise ValueError('No Alaska_SIC product for month %s in %s' \
+                         % (month,directory))
+    if filename is None:
+        filename = os.path.join(directory,'EOF_%s.npz' % os.path.splitext(
+                                            os.path.basename(product))[0])
+
+    ### Saved EOFs are current if newer than the product (and same setup)
+    if os.path.exists(filename) and \
+            os.path.getmtime(filename) >= os.path.getmtime(product):
+        eof = loadEOF(filename)
+        sameMask = (mask is None and not eof['masked']) or \
+                   (mask is not None and eof['masked'] and
+                    np.array_equal(np.asarray(mask),eof['mask']))
+        if eof['eofs'].shape[0] == neofs and sameMask:
+            return eof['years'],eof['eofs'],eof['pcs'],eof['varfrac']
+
+    data = Dataset(product)
+    years = data.variables['years'][:]
+    lat1 = data.variables['lat'][:]
+    lon1 = data.variables['lon'][:]
+    area = GA.gridArea('atlas',lat1,lon1)
+    eofs,pcs,varfrac,mean = eofStream(data.variables['sic'],area,mask,neofs)
+    data.close()
+
+    arrays = {'years' : years,'eofs' : eofs,'pcs' : pcs,
+              'varfrac' : varfrac,'mean' : mean,'lat' : lat1,'lon' : lon1,
+              'masked' : mask is not None}
+    if mask is not None:
+        arrays['mask'] = np.asarray(mask)
+    np.savez(filename,**arrays)
+
+    return years,eofs,pcs,varfrac
+
+def loadEOF(filename):
+    """
+    Function loads EOFs saved by eofAlaska
+
+    Parameters
+    ----------
+    filename : string
+        path of the saved EOFs (.npz)
+
+    Returns
+    -------
+    eof : dictionary
+        years, eofs, pcs, varfrac, mean, lat, lon, masked (and mask)
+
+    Usage
+    -----
+    eof = loadEOF(filename)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    with np.load(filename) as data:
+        eof = {name : data[name] for name in data.files}
+    eof['masked'] = bool(eof['masked'])
+
+    return eof
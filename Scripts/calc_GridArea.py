@@ -0,0 +1,259 @@
+"""
+Functions calculate exact cell areas for each dataset grid used in this
+project and cache them as read-only float32 arrays (on disk when a cache
+directory is given), so extent, area and volume calculations do no trig.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    areaLatLon(lat1,lon1)
+    areaStereoNSIDC()
+    areaCurvilinear(lats,lons,periodic)
+    gridArea(grid,lats,lons,cachedir)
+"""
+
+### Earth radius (km) for spherical grids
+radius = 6371.
+
+### Decoded/calculated areas (filled on first use)
+_areas = {}
+
+def areaLatLon(lat1,lon1):
+    """
+    Function calculates exact spherical areas of a regular lat/lon grid
+    (e.g. the 0.25 Alaska Sea Ice Atlas grid). Cell edges are halfway
+    between the centers.
+
+    Parameters
+    ----------
+    lat1 : 1d array
+        latitudes of cell centers
+    lon1 : 1d array
+        longitudes of cell centers
+
+    Returns
+    -------
+    area : 2d array [lat,lon]
+        area of each grid cell (km^2)
+
+    Usage
+    -----
+    area = areaLatLon(lat1,lon1)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    def edges(coord):
+        coord = np.asarray(coord,dtype=float)
+        mid = (coord[1:] + coord[:-1])/2.
+        return np.concatenate([[2*coord[0]-mid[0]],mid,
+                               [2*coord[-1]-mid[-1]]])
+
+    latedge = np.radians(np.clip(edges(lat1),-90.,90.))
+    lonedge = np.radians(edges(lon1))
+
+    ### Area between two parallels and two meridians
+    band = np.abs(np.diff(np.sin(latedge)))
+    width = np.abs(np.diff(lonedge))
+    area = radius**2 * band[:,np.newaxis] * width[np.newaxis,:]
+
+    return area
+
+def areaStereoNSIDC():
+    """
+    Function calculates exact areas of the NSIDC 25 km polar stereographic
+    grid [448,304] (Hughes 1980 ellipsoid, true at 70N) from the map scale
+    factor of each cell
+
+    Returns
+    -------
+    area : 2d array [448,304]
+        area of each grid cell (km^2)
+
+    Usage
+    -----
+    area = areaStereoNSIDC()
+    """
+
+    ### Import modules
+    import numpy as np
+
+    ### Projection constants
+    a = 6378.273
+    e = 0.081816153
+    phic = np.radians(70.)
+
+    def tfun(phi):
+        return np.tan(np.pi/4. - phi/2.) / \
+               ((1. - e*np.sin(phi))/(1. + e*np.sin(phi)))**(e/2.)
+
+    def mfun(phi):
+        return np.cos(phi)/np.sqrt(1. - (e*np.sin(phi))**2)
+
+    ### Cell centers of the grid (km)
+    x = -3850. + 25.*(np.arange(304) + 0.5)
+    y = 5850. - 25.*(np.arange(448) + 0.5)
+    x2,y2 = np.meshgrid(x,y)
+    rho = np.hypot(x2,y2)
+
+    ### Inverse projection for latitude (iterated on the ellipsoid)
+    t = rho*tfun(phic)/(a*mfun(phic))
+    phi = np.pi/2. - 2.*np.arctan(t)
+    for i in range(10):
+        phi = np.pi/2. - 2.*np.arctan(t*((1. - e*np.sin(phi)) / \
+                                         (1. + e*np.sin(phi)))**(e/2.))
+
+    ### True area is the projected area over the squared scale factor
+    k = rho/(a*mfun(phi))
+    area = 25.**2/k**2
+
+    return area
+
+def areaCurvilinear(lats,lons,periodic=False):
+    """
+    Function calculates spherical cell areas on a curvilinear grid from the
+    cell centers (corners are estimated halfway between centers), e.g. the
+    PIOMAS or OSISAF grids
+
+    Parameters
+    ----------
+    lats : 2d array
+        latitudes of cell centers
+    lons : 2d array
+        longitudes of cell centers
+    periodic : boolean, optional
+        the last dimension wraps around (e.g. PIOMAS), so the seam cells use
+        the centers across the seam instead of extrapolated ones
+
+    Returns
+    -------
+    area : 2d array
+        area of each grid cell (km^2)
+
+    Usage
+    -----
+    area = areaCurvilinear(lats,lons,periodic)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    ### Unit vectors of the cell centers
+    phi = np.radians(np.ma.getdata(lats))
+    lam = np.radians(np.ma.getdata(lons))
+    xyz = np.stack([np.cos(phi)*np.cos(lam),np.cos(phi)*np.sin(lam),
+                    np.sin(phi)],axis=-1)
+
+    ### Extrapolate one row/column of centers around the grid (columns are
+    ### wrapped across the seam of a periodic grid)
+    xyz = np.concatenate([2*xyz[:1]-xyz[1:2],xyz,2*xyz[-1:]-xyz[-2:-1]],
+                         axis=0)
+    if periodic:
+        xyz = np.concatenate([xyz[:,-1:],xyz,xyz[:,:1]],axis=1)
+    else:
+        xyz = np.concatenate([2*xyz[:,:1]-xyz[:,1:2],xyz,
+                              2*xyz[:,-1:]-xyz[:,-2:-1]],axis=1)
+
+    ### Corners are the mean of the four surrounding centers
+    corner = (xyz[:-1,:-1] + xyz[1:,:-1] + xyz[:-1,1:] + xyz[1:,1:])/4.
+    corner /= np.linalg.norm(corner,axis=-1)[...,np.newaxis]
+
+    ### Spherical excess of the two triangles in each cell
+    def excess(a,b,c):
+        num = np.abs(np.sum(a*np.cross(b,c),axis=-1))
+        den = 1. + np.sum(a*b,axis=-1) + np.sum(b*c,axis=-1) \
+                 + np.sum(c*a,axis=-1)
+        return 2.*np.arctan2(num,den)
+
+    c00 = corner[:-1,:-1]
+    c10 = corner[1:,:-1]
+    c01 = corner[:-1,1:]
+    c11 = corner[1:,1:]
+    area = (excess(c00,c10,c11) + excess(c00,c11,c01)) * radius**2
+
+    return area
+
+def gridArea(grid,lats=None,lons=None,cachedir=None):
+    """
+    Function returns the cell areas of a dataset grid, calculating them only
+    once per grid (per process, and across runs when cachedir is given)
+
+    Parameters
+    ----------
+    grid : string
+        'atlas' (1d lat/lon), 'cdr' (NSIDC 25 km), 'osisaf' or 'piomas'
+        (2d curvilinear lat/lon)
+    lats : 1d or 2d array, optional
+        latitudes of cell centers (not needed for 'cdr')
+    lons : 1d or 2d array, optional
+        longitudes of cell centers (not needed for 'cdr')
+    cachedir : string, optional
+        directory to store the areas as .npy files
+
+    Returns
+    -------
+    area : 2d array
+        area of each grid cell (km^2), read-only float32
+
+    Usage
+    -----
+    area = gridArea(grid,lats,lons,cachedir)
+    """
+
+    ### Import modules
+    import numpy as np
+    import hashlib
+    import os
+
+    functions = {'atlas' : areaLatLon,
+                 'cdr' : areaStereoNSIDC,
+                 'osisaf' : areaCurvilinear,
+                 'piomas' : areaCurvilinear}
+    if grid not in functions:
+        raise ValueError('Unknown grid "%s", choose from %s' \
+                         % (grid,sorted(functions)))
+
+    ### Key areas on the grid coordinates
+    key = hashlib.sha1(grid.encode())
+    for coord in (lats,lons):
+        if coord is not None:
+            coord = np.ascontiguousarray(np.ma.getdata(coord),dtype='float64')
+            key.update(str(coord.shape).encode())
+            key.update(coord.tobytes())
+    key = '%s_%s' % (grid,key.hexdigest()[:16])
+
+    ### PIOMAS is periodic in i
+    periodic = grid == 'piomas'
+    if periodic:
+        key = key + '_periodic'
+
+    if key in _areas:
+        return _areas[key]
+
+    filename = None
+    if cachedir is not None:
+        filename = os.path.join(cachedir,'area_%s.npy' % key)
+
+    if filename is not None and os.path.exists(filename):
+        area = np.load(filename,mmap_mode='r')
+    else:
+        if grid == 'cdr':
+            area = functions[grid]()
+        elif grid == 'atlas':
+            area = functions[grid](lats,lons)
+        else:
+            area = functions[grid](lats,lons,periodic)
+        area = area.astype('float32')
+        if filename is not None:
+            np.save(filename,area)
+            area = np.load(filename,mmap_mode='r')
+        else:
+            area.flags.writeable = False
+
+    _areas[key] = area
+    return area
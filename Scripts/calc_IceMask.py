@@ -0,0 +1,180 @@
+"""
+Functions store the ice/no-ice mask (SIC >= a threshold) of every year of a
+SIC cube as bits packed along the year axis (1 bit instead of a float per
+year and grid cell) and answer frequency-style questions with popcounts:
+ice-occurrence frequency over any group of years, first/last ice year of
+each cell and cells with ice in all (or any) years of a group.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    IceMask(sic,years,thresh,chunk)
+    loadMask(filename)
+"""
+
+### Number of set bits, first and last set year of every byte value (bits
+### are packed in numpy's big order, year 8*b + i is bit 7 - i of byte b)
+def _tables():
+    import numpy as np
+    values = np.arange(256)
+    bits = (values[:,np.newaxis] >> (7 - np.arange(8))) & 1
+    count = bits.sum(axis=1).astype('uint8')
+    low = np.where(values > 0,np.argmax(bits,axis=1),0).astype('uint8')
+    high = np.where(values > 0,7 - np.argmax(bits[:,::-1],axis=1),
+                    0).astype('uint8')
+    return count,low,high
+
+_popcount,_lowbit,_highbit = _tables()
+
+class IceMask(object):
+    """
+    Bit-packed [year,...] ice mask of a SIC cube (bit 7 - i of byte b is
+    year 8*b + i). Missing values (nan, masked or compact 255) are not ice.
+
+    Usage
+    -----
+    icemask = IceMask(sic,years,thresh,chunk)
+    freq = icemask.frequency(years)
+    first = icemask.first()
+    last = icemask.last()
+    always = icemask.always(years)
+    ever = icemask.ever(years)
+    """
+
+    def __init__(self,sic,years,thresh=15.,chunk=64):
+        import numpy as np
+        import calc_CompactSIC as CS
+
+        self.years = np.asarray(years)
+        self.thresh = thresh
+        if len(sic) != self.years.shape[0]:
+            raise ValueError('sic has %s years but %s years were given!' \
+                             % (len(sic),self.years.shape[0]))
+
+        ### Pack chunks of whole bytes (chunk is a multiple of 8 years)
+        chunk = max(8,chunk - chunk % 8)
+        nyears = self.years.shape[0]
+        self.bits = None
+        for yr in range(0,nyears,chunk):
+            iceq = sic[yr:yr+chunk]
+            ice = np.asarray(np.ma.getdata(iceq))
+            with np.errstate(invalid='ignore'):
+                mask = ice >= thresh
+            if np.ma.is_masked(iceq):
+                mask &= ~np.ma.getmaskarray(iceq)
+            if ice.dtype == np.uint8:
+                mask &= ice != CS.missing
+            if self.bits is None:
+                self.bits = np.zeros(((nyears+7)//8,) + mask.shape[1:],
+                                     dtype='uint8')
+            self.bits[yr//8:(yr+mask.shape[0]+7)//8] = np.packbits(mask,
+                                                                   axis=0)
+
+    def _group(self,years):
+        """
+        Packed selection of years (all years if None), one byte per row
+        """
+        import numpy as np
+
+        if years is None:
+            select = np.ones(self.years.shape,dtype=bool)
+        else:
+            select = np.any(self.years == np.ravel(years)[:,np.newaxis],
+                            axis=0)
+        group = np.packbits(select)
+        return group.reshape((-1,) + (1,)*(self.bits.ndim-1)),np.sum(select)
+
+    def count(self,years=None):
+        import numpy as np
+
+        group,nyears = self._group(years)
+        count = np.zeros(self.bits.shape[1:],dtype='int32')
+        for b in range(self.bits.shape[0]):
+            count += _popcount[self.bits[b] & group[b]]
+        return count
+
+    def frequency(self,years=None):
+        group,nyears = self._group(years)
+        if nyears == 0:
+            raise ValueError('No years of %s in the ice mask!' % years)
+        return self.count(years)/float(nyears)
+
+    def always(self,years=None):
+        group,nyears = self._group(years)
+        return self.count(years) == nyears
+
+    def ever(self,years=None):
+        return self.count(years) > 0
+
+    def _byte(self,byte):
+        """
+        Byte of the packed years at index byte [...] of every cell
+        """
+        import numpy as np
+
+        bits = np.reshape(self.bits,(self.bits.shape[0],-1))
+        value = bits[np.ravel(byte),np.arange(bits.shape[1])]
+        return np.reshape(value,np.shape(byte))
+
+    def first(self):
+        """
+        Returns the first year with ice of each cell (-1 if never ice)
+        """
+        import numpy as np
+
+        nonzero = self.bits != 0
+        byte = np.argmax(nonzero,axis=0)
+        value = self._byte(byte)
+        index = np.minimum(8*byte + _lowbit[value],self.years.shape[0]-1)
+        return np.where(np.any(nonzero,axis=0),self.years[index],-1)
+
+    def last(self):
+        """
+        Returns the last year with ice of each cell (-1 if never ice)
+        """
+        import numpy as np
+
+        nonzero = self.bits[::-1] != 0
+        byte = self.bits.shape[0] - 1 - np.argmax(nonzero,axis=0)
+        value = self._byte(byte)
+        index = np.minimum(8*byte + _highbit[value],self.years.shape[0]-1)
+        return np.where(np.any(nonzero,axis=0),self.years[index],-1)
+
+    def save(self,filename):
+        import numpy as np
+        np.savez(filename,bits=self.bits,years=self.years,
+                 thresh=self.thresh)
+
+def loadMask(filename):
+    """
+    Function loads an ice mask written with IceMask.save
+
+    Parameters
+    ----------
+    filename : string
+        path of the .npz file
+
+    Returns
+    -------
+    icemask : IceMask
+        bit-packed ice mask
+
+    Usage
+    -----
+    icemask = loadMask(filename)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    icemask = IceMask.__new__(IceMask)
+    with np.load(filename) as data:
+        icemask.bits = data['bits']
+        icemask.years = data['years']
+        icemask.thresh = float(data['thresh'])
+
+    return icemask
@@ -0,0 +1,161 @@
+"""
+Functions read the Arctic regional mask (Meier et al. 2007) on the NSIDC
+25 km polar stereographic grid [448,304]. The .msk file is decoded once and
+the flat cell indices of each region are cached, so regional reductions only
+gather the cells of that region.
+
+Notes
+-----
+    Source : Meier, W.N., J. Stroeve, and F. Fetterer, 2007: Whither Arctic
+             sea ice? Annals of Glaciology, 46, 428-434
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    readMask(filename)
+    regionIndex(region,filename)
+    regionSum(field,region,weights,filename)
+"""
+
+### Region codes in Arctic_region_mask_Meier_AnnGlaciol2007.msk
+regions = {'lakes' : 0,
+           'ocean' : 1,
+           'okhotsk' : 2,
+           'bering' : 3,
+           'hudson' : 4,
+           'stlawrence' : 5,
+           'baffin' : 6,
+           'greenland' : 7,
+           'barents' : 8,
+           'kara' : 9,
+           'laptev' : 10,
+           'eastsiberian' : 11,
+           'chukchi' : 12,
+           'beaufort' : 13,
+           'canadianarchipelago' : 14,
+           'centralarctic' : 15,
+           'land' : 20,
+           'coast' : 21}
+
+### Decoded masks and region indices (filled on first use)
+_masks = {}
+_indices = {}
+
+def _defaultMask():
+    import os
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),'..',
+                        'Data','Arctic_region_mask_Meier_AnnGlaciol2007.msk')
+
+def readMask(filename=None):
+    """
+    Function decodes the regional mask file (uint8 codes) once per process
+
+    Parameters
+    ----------
+    filename : string, optional
+        path of the .msk file (default is Data/ of this repository)
+
+    Returns
+    -------
+    mask : 2d array [448,304]
+        region code of each grid cell (read-only)
+
+    Usage
+    -----
+    mask = readMask(filename)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if filename is None:
+        filename = _defaultMask()
+
+    if filename not in _masks:
+        mask = np.fromfile(filename,dtype='uint8')
+        if mask.size != 448*304:
+            raise ValueError('Issue with reshaping region mask %s' % filename)
+        mask = np.reshape(mask,(448,304))
+        mask.flags.writeable = False
+        _masks[filename] = mask
+
+    return _masks[filename]
+
+def regionIndex(region,filename=None):
+    """
+    Function returns the flat cell indices of a region on the 25 km grid
+
+    Parameters
+    ----------
+    region : string or integer
+        name of the region (e.g. 'bering') or its code
+    filename : string, optional
+        path of the .msk file
+
+    Returns
+    -------
+    index : 1d array
+        flat indices of the region cells (read-only)
+
+    Usage
+    -----
+    index = regionIndex(region,filename)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if filename is None:
+        filename = _defaultMask()
+    if isinstance(region,str):
+        if region.lower() not in regions:
+            raise ValueError('Unknown region "%s", choose from %s' \
+                             % (region,sorted(regions)))
+        region = regions[region.lower()]
+
+    key = (filename,region)
+    if key not in _indices:
+        index = np.flatnonzero(readMask(filename) == region)
+        index.flags.writeable = False
+        _indices[key] = index
+
+    return _indices[key]
+
+def regionSum(field,region,weights=None,filename=None):
+    """
+    Function sums a field over the cells of a region (nan are ignored)
+
+    Parameters
+    ----------
+    field : nd array [...,448,304]
+        field on the 25 km grid, leading dimensions are kept
+    region : string or integer
+        name of the region (e.g. 'bering') or its code
+    weights : 2d array [448,304], optional
+        weight of each cell (e.g. cell area or extent indicator)
+    filename : string, optional
+        path of the .msk file
+
+    Returns
+    -------
+    total : nd array [...]
+        regional sum
+
+    Usage
+    -----
+    total = regionSum(field,region,weights,filename)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    index = regionIndex(region,filename)
+
+    ### Gather region cells before any type conversion
+    cells = np.reshape(field,np.shape(field)[:-2] + (-1,))[...,index]
+    cells = np.ma.filled(np.ma.asarray(cells,dtype=float),np.nan)
+    if weights is not None:
+        cells = cells * np.ravel(weights)[index]
+
+    return np.nansum(cells,axis=-1)
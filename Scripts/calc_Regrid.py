@@ -0,0 +1,145 @@
+"""
+Functions regrid sea ice concentration (e.g. OSISAF 10 km) onto the 0.25
+Alaska Sea Ice Atlas grid. Linear (Delaunay/barycentric) interpolation
+weights are computed once, stored on disk as a sparse matrix keyed by the
+source and target grids, and applied as a sparse matrix-vector product.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    weightsLinear(latold,lonold,latnew,lonnew)
+    Regridder(latold,lonold,latnew,lonnew,cachedir)
+"""
+
+def weightsLinear(latold,lonold,latnew,lonnew):
+    """
+    Function calculates the linear interpolation weights used by
+    scipy.interpolate.griddata(...,method='linear')
+
+    Parameters
+    ----------
+    latold,lonold : 2d arrays
+        latitudes/longitudes of the source grid
+    latnew,lonnew : 2d arrays
+        latitudes/longitudes of the target grid
+
+    Returns
+    -------
+    weights : sparse matrix [target,source]
+        barycentric weights (3 per target point)
+    outside : 1d array [target]
+        boolean, target points outside the source triangulation
+
+    Usage
+    -----
+    weights,outside = weightsLinear(latold,lonold,latnew,lonnew)
+    """
+
+    print('\n>>> Using weightsLinear function!')
+
+    ### Import modules
+    import numpy as np
+    from scipy.spatial import Delaunay
+    import scipy.sparse as sp
+
+    points = np.column_stack([np.ravel(latold),np.ravel(lonold)])
+    xi = np.column_stack([np.ravel(latnew),np.ravel(lonnew)])
+
+    ### Triangulate the source grid once
+    tri = Delaunay(points)
+    simplex = tri.find_simplex(xi)
+    outside = simplex < 0
+
+    ### Barycentric coordinates of each target point
+    transform = tri.transform[simplex]
+    delta = xi - transform[:,2]
+    bary = np.einsum('ijk,ik->ij',transform[:,:2],delta)
+    weightq = np.column_stack([bary,1. - bary.sum(axis=1)])
+
+    rows = np.repeat(np.arange(xi.shape[0]),3)
+    cols = tri.simplices[simplex].ravel()
+    vals = weightq.ravel()
+    vals[np.repeat(outside,3)] = 0.
+
+    weights = sp.csr_matrix((vals,(rows,cols)),
+                            shape=(xi.shape[0],points.shape[0]))
+
+    print('*Completed: Triangulated %s source points!' % points.shape[0])
+    return weights,outside
+
+class Regridder(object):
+    """
+    Linear regridder from a source to a target grid. Weights are loaded
+    from cachedir when the same grids were used before.
+
+    Usage
+    -----
+    regrid = Regridder(latold,lonold,latnew,lonnew,cachedir)
+    var = regrid(field)
+    vardaily = regrid(fields[day,y,x])
+    """
+
+    def __init__(self,latold,lonold,latnew,lonnew,cachedir=None):
+        import numpy as np
+        import scipy.sparse as sp
+        import hashlib
+        import os
+
+        latold = np.ma.getdata(latold)
+        lonold = np.ma.getdata(lonold)
+        latnew = np.ma.getdata(latnew)
+        lonnew = np.ma.getdata(lonnew)
+        self.shapeold = np.shape(latold)
+        self.shapenew = np.shape(latnew)
+
+        ### Key weights on the coordinates of both grids
+        key = hashlib.sha1()
+        for coord in (latold,lonold,latnew,lonnew):
+            coord = np.ascontiguousarray(coord,dtype='float64')
+            key.update(str(coord.shape).encode())
+            key.update(coord.tobytes())
+        self.key = key.hexdigest()[:16]
+
+        filename = None
+        if cachedir is not None:
+            filename = os.path.join(cachedir,'regrid_linear_%s.npz' % self.key)
+
+        if filename is not None and os.path.exists(filename):
+            cache = np.load(filename)
+            self.weights = sp.csr_matrix((cache['data'],cache['indices'],
+                                          cache['indptr']),
+                                         shape=tuple(cache['shape']))
+            self.outside = cache['outside']
+        else:
+            self.weights,self.outside = weightsLinear(latold,lonold,
+                                                      latnew,lonnew)
+            if filename is not None:
+                np.savez(filename,data=self.weights.data,
+                         indices=self.weights.indices,
+                         indptr=self.weights.indptr,
+                         shape=np.asarray(self.weights.shape),
+                         outside=self.outside)
+
+    def __call__(self,field):
+        """
+        Regrid a single field [y,x] or a stack of fields [...,y,x] (e.g.
+        [day,y,x]) with one batched sparse product on the shared weights
+        """
+        import numpy as np
+
+        field = np.ma.filled(np.ma.asarray(field,dtype='float64'),np.nan)
+        if field.shape[-2:] != self.shapeold:
+            raise ValueError('Field shape %s does not match source grid %s' \
+                             % (field.shape,self.shapeold))
+        stack = field.shape[:-2]
+
+        ### Columns are the fields of the stack [source,field]
+        fields = np.reshape(field,(-1,self.weights.shape[1])).T
+        var = self.weights.dot(fields)
+        var[self.outside,:] = np.nan
+
+        return np.reshape(var.T,stack + self.shapenew)
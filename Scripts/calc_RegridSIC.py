@@ -12,7 +12,8 @@ import numpy as np
 from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 import datetime
-from scipy.interpolate import griddata as g
+import calc_Regrid as CR
+import read_OSISAF as RO
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice/SIC_Alaska/' 
@@ -30,7 +31,6 @@ print('\n' '----Plotting Bering SIC - %s----' % titletime)
 
 ### Define years
 years = np.arange(1850,2018+1,1)
-days = np.arange(1,28+1,1)
 
 ### Retrieve data from historical sea ice atlas (0.25)
 filename = directorydata + 'SNAP_SEA_ICE_ATLAS_MAR.nc'
@@ -47,27 +47,13 @@ print('Completed: Data read!')
 ### Meshgrid
 lon2,lat2 = np.meshgrid(lon1,lat1)
 
-### Read in 2018 data
-sic19 = np.empty((31,849,849))
-for i in range(days.shape[0]):
-    if days[i] < 10:
-        filename = directorydata2 + 'mar_2019_%s.nc' % days[i]
-    else:
-        filename = directorydata2 + 'mar_2019_%s.nc' % days[i]
-    data = Dataset(filename,'r')
-    sic19[i,:,:] = data.variables['ice_conc'][:]
-    latold2 = data.variables['lat'][:]
-    lonold2 = data.variables['lon'][:]
-    data.close()
-    
-sic19[np.where(sic19 == -999)] = np.nan
-
-### Calculate monthly average
-sicmean = np.nanmean(sic19,axis=0)
+### Read in daily data and calculate monthly average (streaming)
+filenames = RO.filesOSISAF(directorydata2,2019,3)
+latold2,lonold2,sicmean = RO.meanOSISAF(filenames)
 
-#### Regrid data
-ak = g((np.ravel(latold2),np.ravel(lonold2)),sicmean.ravel(),(lat2,lon2),
-       method='linear')
+#### Regrid data (weights are cached for the OSISAF and atlas grids)
+regrid = CR.Regridder(latold2,lonold2,lat2,lon2,directorydata)
+ak = regrid(sicmean)
 
 def netcdfAlaska(lats,lons,var,directory):
     print('\n>>> Using netcdfAlaska function!')
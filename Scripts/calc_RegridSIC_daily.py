@@ -0,0 +1,94 @@
+"""
+Regrid daily SIC data from 10 km to 0.25 grid (all days at once)
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+"""
+
+### Import modules
+import numpy as np
+from netCDF4 import Dataset
+import datetime
+import calc_Regrid as CR
+import read_OSISAF as RO
+
+### Define directories
+directorydata = '/surtsey/zlabe/seaice/SIC_Alaska/'
+directorydata2 = '/surtsey/zlabe/seaice/SIC_Alaska/sic2019/'
+directoryfigure = '/home/zlabe/Documents/Projects/BeringSeaIce2018/Figures/'
+
+### Define time
+now = datetime.datetime.now()
+currentmn = str(now.month)
+currentdy = str(now.day)
+currentyr = str(now.year)
+currenttime = currentmn + '_' + currentdy + '_' + currentyr
+titletime = currentmn + '/' + currentdy + '/' + currentyr
+print('\n' '----Regridding daily Bering SIC - %s----' % titletime)
+
+### Define days
+year = 2019
+month = 3
+filenames = RO.filesOSISAF(directorydata2,year,month)
+days = np.arange(1,len(filenames)+1,1)
+
+### Retrieve grid from historical sea ice atlas (0.25)
+filename = directorydata + 'SNAP_SEA_ICE_ATLAS_MAR.nc'
+
+data = Dataset(filename)
+lat1 = data.variables['lat'][:]
+lon1 = data.variables['lon'][:]
+data.close()
+
+### Meshgrid
+lon2,lat2 = np.meshgrid(lon1,lat1)
+
+### Read in daily data [day,y,x] (missing values and days are nan)
+latold2,lonold2,sicday = RO.dailyOSISAF(filenames)
+
+print('Completed: Data read!')
+
+#### Regrid all days in one batch on the shared weights
+regrid = CR.Regridder(latold2,lonold2,lat2,lon2,directorydata)
+ak = regrid(sicday)
+
+def netcdfAlaskaDaily(lats,lons,var,days,directory):
+    print('\n>>> Using netcdfAlaskaDaily function!')
+
+    name = 'Alaska_SIC_Mar_2019_daily.nc'
+    filename = directory + name
+    ncfile = Dataset(filename,'w',format='NETCDF4')
+    ncfile.description = 'Daily March 2019 SIC from OSISAF ' \
+                        'interpolated on grid from ' \
+                        'Alaska Sea Ice Atlas'
+
+    ### Dimensions
+    ncfile.createDimension('day',var.shape[0])
+    ncfile.createDimension('lat',var.shape[1])
+    ncfile.createDimension('lon',var.shape[2])
+
+    ### Variables
+    day = ncfile.createVariable('day','i4',('day'))
+    latitude = ncfile.createVariable('lat','f4',('lat','lon'))
+    longitude = ncfile.createVariable('lon','f4',('lat','lon'))
+    varns = ncfile.createVariable('sic','f4',('day','lat','lon'))
+
+    ### Units
+    varns.units = '%'
+    ncfile.title = 'OSISAF SIC on AK Sea Ice Atlas Grid'
+    ncfile.instituion = 'Dept. ESS at University of California, Irvine'
+    ncfile.source = 'http://osisaf.met.no/p/ice/'
+    ncfile.references = 'SSMIS (DMSP F18)]'
+
+    ### Data
+    day[:] = days
+    latitude[:] = lats
+    longitude[:] = lons
+    varns[:] = var
+
+    ncfile.close()
+    print('*Completed: Created netCDF4 File!')
+
+netcdfAlaskaDaily(lat2,lon2,ak,days,directorydata)
@@ -10,7 +10,10 @@ Notes
 ### Import modules
 import numpy as np
 import datetime
+import read_SeriesStore as RS
 import scipy.stats as sts
+import calc_Climatology as CL
+import calc_Significance as SG
 
 ### Define directories
 directorydata2 = '/home/zlabe/Documents/Projects/BeringSeaIce2018/Data/'
@@ -30,15 +33,31 @@ years = np.arange(1850,2018+1,1)
 yearsat = np.arange(1979,2018+1,1)
 
 ### Retrieve data from NSIDC regional extent in Bering Sea
-ice = np.genfromtxt(directorydata2 + 'Bering_SIE_iceatlas_' \
-                          '02_1850-2018.txt',skip_header=1)
+store = RS.readStore(directorydata2)
+ice = store.query('atlas','bering','extent',2,years)
 
-### Slice data based on time
-yearq = np.where((years>=1979) & (years<=2017))[0]
-icebase = ice[yearq]
-
-yearqq = np.where((years>=1942) & (years<=1978))[0]
-oldicebase = ice[yearqq]
+### Baseline statistics from prefix sums over the years
+index = CL.YearIndex(ice,years,squares=True)
+icebase = index.mean(1979,2017)
+oldicebase = index.mean(1942,1978)
+oldq = index.window(1942,1978)
+newq = index.window(1979,2017)
 
 ### Calculate t test
-t,pvalue = sts.ttest_ind(oldicebase,icebase)
+t,pvalue = sts.ttest_ind_from_stats(oldicebase,
+                                    np.sqrt(index.var(1942,1978)),
+                                    index.n(1942,1978),
+                                    icebase,
+                                    np.sqrt(index.var(1979,2017)),
+                                    index.n(1979,2017))
+
+### Welch t-test and permutation test of the difference
+oldice = ice[oldq]
+newice = ice[newq]
+tw,pwelch = SG.ttestWelch(oldice,newice)
+diff,pperm = SG.resampleTest(oldice,newice,'permutation',10000)
+
+print('\n>>> 1942-1978 minus 1979-2017 SIE ---> %s' % np.round(diff,3))
+print('t test (equal variances) p-value ---> %s' % np.round(pvalue,4))
+print('Welch t test p-value ---> %s' % np.round(pwelch,4))
+print('Permutation test p-value ---> %s' % np.round(pperm,4))
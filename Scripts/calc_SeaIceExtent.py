@@ -0,0 +1,263 @@
+"""
+Functions calculate sea ice extent from gridded sea ice concentration using
+batched array reductions over a precomputed cell-area grid (see
+calc_GridArea)
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    regionBering(lat1,lon1,latmax)
+    calcExtent(sic,thresh,mask,area,chunk)
+    calcExtentThresholds(sic,thresholds,mask,area,chunk)
+    calcRegions(sic,labels,area,thresh,chunk)
+"""
+
+def regionBering(lat1,lon1,latmax):
+    """
+    Function creates the Bering Sea mask used for the ice atlas extent
+
+    Parameters
+    ----------
+    lat1 : 1d array
+        latitudes
+    lon1 : 1d array
+        longitudes
+    latmax : float
+        northern boundary of the region (degrees)
+
+    Returns
+    -------
+    mask : 2d array [lat,lon]
+        boolean mask of grid cells within the region
+
+    Usage
+    -----
+    mask = regionBering(lat1,lon1,latmax)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    ### Bering Sea Ice Mask
+    lat1 = np.asarray(lat1,dtype=float)
+    maskq = (lat1 > 0.) & (lat1 <= latmax)
+    mask = np.repeat(maskq[:,np.newaxis],np.size(lon1),axis=1)
+
+    return mask
+
+def calcExtent(sic,thresh,mask,area,chunk=24):
+    """
+    Function calculates sea ice extent for every year of a SIC cube
+
+    Parameters
+    ----------
+    sic : 3d array [year,lat,lon]
+        sea ice concentration (%), masked and compact uint8 arrays are
+        supported
+    thresh : float
+        minimum SIC (%) for a grid cell to count as ice covered
+    mask : 2d array [lat,lon]
+        boolean region mask (or None for the full grid)
+    area : 2d array [lat,lon]
+        area of each grid cell (km^2)
+    chunk : integer, optional
+        number of years reduced at once
+
+    Returns
+    -------
+    ext : 1d array [year]
+        sea ice extent (10^6 km^2)
+
+    Usage
+    -----
+    ext = calcExtent(sic,thresh,mask,area,chunk)
+    """
+
+    print('\n>>> Using calcExtent function!')
+
+    ### Import modules
+    import numpy as np
+    import calc_CompactSIC as CS
+
+    ### Gather only the grid cells within the region
+    if mask is None:
+        cells = np.arange(area.size)
+    else:
+        cells = np.flatnonzero(np.asarray(mask))
+    weights = np.ravel(area)[cells]
+
+    ### Reduce chunks of years so no full-size buffer is created
+    ext = np.zeros((sic.shape[0]))
+    for yr in range(0,sic.shape[0],chunk):
+        iceq = sic[yr:yr+chunk]
+        ice = np.reshape(np.ma.getdata(iceq),(iceq.shape[0],-1))[:,cells]
+        valid = ice >= thresh
+        if np.ma.is_masked(iceq):
+            missing = np.reshape(np.ma.getmaskarray(iceq),
+                                 (iceq.shape[0],-1))[:,cells]
+            valid &= ~missing
+        if ice.dtype == np.uint8:
+            valid &= ice != CS.missing
+        ext[yr:yr+chunk] = np.dot(valid,weights)/1e6
+
+    print('*Completed: Calculated sea ice extent (threshold %s%%)!' % thresh)
+    return ext
+
+def calcExtentThresholds(sic,thresholds,mask,area,chunk=24):
+    """
+    Function calculates sea ice extent for many SIC thresholds in one scan
+    of the data using area-weighted cumulative histograms of SIC
+
+    Parameters
+    ----------
+    sic : 3d array [year,lat,lon]
+        sea ice concentration (%), masked and compact uint8 arrays are
+        supported
+    thresholds : 1d array
+        minimum SIC (%) values for a grid cell to count as ice covered
+    mask : 2d array [lat,lon]
+        boolean region mask (or None for the full grid)
+    area : 2d array [lat,lon]
+        area of each grid cell (km^2)
+    chunk : integer, optional
+        number of years reduced at once
+
+    Returns
+    -------
+    ext : 2d array [threshold,year]
+        sea ice extent (10^6 km^2) in the order of thresholds
+
+    Usage
+    -----
+    ext = calcExtentThresholds(sic,thresholds,mask,area,chunk)
+    """
+
+    print('\n>>> Using calcExtentThresholds function!')
+
+    ### Import modules
+    import numpy as np
+    import calc_CompactSIC as CS
+
+    thresholds = np.atleast_1d(np.asarray(thresholds,dtype=float))
+    order = np.argsort(thresholds)
+    threshsort = thresholds[order]
+    nbins = threshsort.shape[0] + 1
+
+    ### Gather only the grid cells within the region
+    if mask is None:
+        cells = np.arange(area.size)
+    else:
+        cells = np.flatnonzero(np.asarray(mask))
+    weights = np.ravel(area)[cells]
+
+    histo = np.zeros((sic.shape[0],nbins))
+    for yr in range(0,sic.shape[0],chunk):
+        iceq = sic[yr:yr+chunk]
+        nyr = iceq.shape[0]
+        ice = np.reshape(np.ma.getdata(iceq),(nyr,-1))[:,cells]
+        valid = np.isfinite(ice)
+        if np.ma.is_masked(iceq):
+            valid &= ~np.reshape(np.ma.getmaskarray(iceq),(nyr,-1))[:,cells]
+        if ice.dtype == np.uint8:
+            valid &= ice != CS.missing
+
+        ### Bin k holds cells with SIC >= the k lowest thresholds
+        binq = np.searchsorted(threshsort,ice,side='right')
+        index = np.arange(nyr)[:,np.newaxis]*nbins + binq
+        histq = np.bincount(index.ravel(),weights=(valid*weights).ravel(),
+                            minlength=nyr*nbins)
+        histo[yr:yr+chunk] = np.reshape(histq,(nyr,nbins))
+
+    ### Extent for threshold i is the area in bins above i
+    cumul = np.cumsum(histo[:,::-1],axis=1)[:,::-1]
+    extsort = cumul[:,1:].T/1e6
+    ext = np.empty(extsort.shape)
+    ext[order] = extsort
+
+    print('*Completed: Calculated sea ice extent for %s thresholds!' \
+          % thresholds.shape[0])
+    return ext
+
+def calcRegions(sic,labels,area,thresh,chunk=12):
+    """
+    Function calculates sea ice extent and area for every region of a label
+    grid at once (e.g. the Meier regional mask) using weighted bincounts
+
+    Parameters
+    ----------
+    sic : nd array [...,y,x]
+        sea ice concentration (%), leading dimensions (e.g. [year,month])
+        are kept, compact uint8 arrays are supported
+    labels : 2d array [y,x]
+        integer region code of each grid cell
+    area : 2d array [y,x] or float
+        area of each grid cell (km^2)
+    thresh : float
+        minimum SIC (%) for a grid cell to count as ice covered
+    chunk : integer, optional
+        number of fields reduced at once
+
+    Returns
+    -------
+    codes : 1d array [region]
+        region codes found in labels
+    ext : nd array [...,region]
+        sea ice extent (10^6 km^2), nan where a region has no valid cell
+    are : nd array [...,region]
+        sea ice area (10^6 km^2), nan where a region has no valid cell
+
+    Usage
+    -----
+    codes,ext,are = calcRegions(sic,labels,area,thresh,chunk)
+    """
+
+    print('\n>>> Using calcRegions function!')
+
+    ### Import modules
+    import numpy as np
+    import calc_CompactSIC as CS
+
+    ### Compact region index of each grid cell
+    codes,label = np.unique(np.ravel(labels),return_inverse=True)
+    nregion = codes.shape[0]
+    weights = np.ravel(np.broadcast_to(area,np.shape(labels))).astype(float)
+
+    lead = np.shape(sic)[:-2]
+    fields = np.reshape(sic,(-1,label.shape[0]))
+    ext = np.zeros((fields.shape[0],nregion))
+    are = np.zeros((fields.shape[0],nregion))
+
+    ### Offset labels so all fields of a chunk share one bincount
+    for t in range(0,fields.shape[0],chunk):
+        ice = fields[t:t+chunk]
+        nfield = ice.shape[0]
+        if np.asarray(ice).dtype == np.uint8:
+            ice = CS.unpackSIC(ice,'float64')
+        else:
+            ice = np.ma.filled(np.ma.asarray(ice,dtype=float),np.nan)
+        valid = ice >= thresh
+        index = (np.arange(nfield)[:,np.newaxis]*nregion + label).ravel()
+
+        extq = np.bincount(index,weights=(valid*weights).ravel(),
+                           minlength=nfield*nregion)
+        sicw = np.where(valid,ice,0.)/100. * weights
+        areq = np.bincount(index,weights=sicw.ravel(),
+                           minlength=nfield*nregion)
+
+        ### Regions without any valid cell (e.g. missing months) are nan
+        nvalid = np.bincount(index,weights=np.isfinite(ice).ravel(),
+                             minlength=nfield*nregion)
+        extq[nvalid == 0] = np.nan
+        areq[nvalid == 0] = np.nan
+        ext[t:t+chunk] = np.reshape(extq,(nfield,nregion))/1e6
+        are[t:t+chunk] = np.reshape(areq,(nfield,nregion))/1e6
+
+    ext = np.reshape(ext,lead + (nregion,))
+    are = np.reshape(are,lead + (nregion,))
+
+    print('*Completed: Calculated extent and area for %s regions!' % nregion)
+    return codes,ext,are
@@ -11,22 +11,59 @@ Notes
     
 Usage
 -----
-    readPIOMAS(directory,years,threshold)
+    regionPiomas(lats,lons,latmin,latmax,lonmin,lonmax)
+    gridPiomas(directory,cachedir)
+    memmapPiomas(directory,years,files,threshold)
+    readPiomas(directory,years,threshold)
     meanThick(yearmin,yearmax,years,sit)
 """
 
-def readPiomas(directory,years,threshold):
+def regionPiomas(lats,lons,latmin,latmax,lonmin,lonmax):
     """
-    Function reads PIOMAS binary and converts to standard numpy array.
+    Function creates a lat/lon box region mask on the PIOMAS grid
+
+    Parameters
+    ----------
+    lats : 2d array
+        latitudes
+    lons : 2d array
+        longitudes (0-360)
+    latmin,latmax : float
+        latitude bounds (degrees)
+    lonmin,lonmax : float
+        longitude bounds (degrees, 0-360)
+
+    Returns
+    -------
+    mask : 2d array
+        boolean mask of grid cells within the region
+
+    Usage
+    -----
+    mask = regionPiomas(lats,lons,latmin,latmax,lonmin,lonmax)
+    """
+    
+    ### Import modules
+    import numpy as np
+    
+    lons = np.mod(lons,360.)
+    mask = (lats >= latmin) & (lats <= latmax) & \
+           (lons >= lonmin) & (lons <= lonmax)
+    
+    return mask
+
+def gridPiomas(directory,cachedir=None):
+    """
+    Function loads the PIOMAS grid (grid.txt) and derived fields from a
+    binary cache. The cache is built the first time and rebuilt whenever
+    the size or modification time of grid.txt changes.
 
     Parameters
     ----------
     directory : string
-        working directory for stored PIOMAS files
-    years : integers
-        years for data files
-    threshold : float
-        mask sea ice thickness amounts < to this value
+        directory of the stored PIOMAS grid.txt
+    cachedir : string, optional
+        directory for the binary cache (default is directory)
 
     Returns
     -------
@@ -34,70 +71,218 @@ def readPiomas(directory,years,threshold):
         latitudes
     lons : 2d array
         longitudes
-    var : 4d array [year,month,lat,lon]
-        sea ice thickness (m) 
+    area : 2d array
+        area of each grid cell (km^2)
+    bering : 2d array
+        boolean Bering Sea mask (52-67N, 157E-157W)
 
     Usage
     -----
-    lats,lons,var = readPiomas(directory,years,threshold)
+    lats,lons,area,bering = gridPiomas(directory,cachedir)
     """
     
-    print('\n>>> Using readPiomas function!\n')
-    
     ### Import modules
     import numpy as np
-    import datetime
+    import os
+    import calc_GridArea as GA
     
-    ### Current times
-    now = datetime.datetime.now()
-    mo = now.month
-    yr = now.year
-    dy = now.day
+    if cachedir is None:
+        cachedir = directory
+    cachedir = os.path.join(cachedir,'grid_cache')
+    source = os.stat(directory + 'grid.txt')
+    key = '%s %s periodic' % (source.st_size,source.st_mtime_ns)
+    fields = ['lats','lons','area','bering']
     
+    ### Memory-map the cached fields if they are current
+    keyfile = os.path.join(cachedir,'source.txt')
+    if os.path.exists(keyfile):
+        with open(keyfile) as f:
+            if f.read().strip() == key:
+                return [np.load(os.path.join(cachedir,'%s.npy' % field),
+                                mmap_mode='r') for field in fields]
+    
+    print('Building PIOMAS grid cache!')
+
     ### Retrieve Grid
     grid = np.genfromtxt(directory + 'grid.txt')
-    grid = np.reshape(grid,(grid.size))  
-    
+    grid = np.reshape(grid,(grid.size))
+
     ### Define Lat/Lon
-    lon = grid[:grid.size//2]   
+    lon = grid[:grid.size//2]
     lons = np.reshape(lon,(120,360))
     lat = grid[grid.size//2:]
     lats = np.reshape(lat,(120,360))
+
+    ### Derived fields
+    area = GA.areaCurvilinear(lats,lons,True).astype('float32')
+    bering = regionPiomas(lats,lons,52,67,157,203)
+    
+    ### Write cache (key last so a partial cache is never used)
+    os.makedirs(cachedir,exist_ok=True)
+    for field,var in zip(fields,[lats,lons,area,bering]):
+        np.save(os.path.join(cachedir,'%s.npy' % field),var)
+    with open(keyfile,'w') as f:
+        f.write(key)
+    
+    return [np.load(os.path.join(cachedir,'%s.npy' % field),
+                    mmap_mode='r') for field in fields]
+
+class PiomasView(object):
+    """
+    Lazy [year,month,lat,lon] view over memory-mapped PIOMAS year files.
+    Data stay float32 on disk and only the indexed slices are read. Months
+    missing from a partial final year are returned as nan.
+
+    Usage
+    -----
+    view = PiomasView(filenames,threshold)
+    var = view[year,month,lat,lon]
+    """
+
+    def __init__(self,filenames,threshold=None):
+        import numpy as np
+
+        self.threshold = threshold
+        self.data = []
+        for filename in filenames:
+            datam = np.memmap(filename,dtype='float32',mode='r')
+            months = datam.shape[0]//(120*360)
+            if months < 1 or months > 12:
+                raise ValueError('Issue with reshaping PIOMAS binary %s' \
+                                 % filename)
+            self.data.append(np.reshape(datam[:months*120*360],
+                                        (months,120,360)))
+        self.shape = (len(self.data),12,120,360)
+        self.ndim = 4
+        self.dtype = np.dtype('float32')
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self,dtype=None,copy=None):
+        var = self[:]
+        return var if dtype is None else var.astype(dtype)
+
+    def __getitem__(self,key):
+        import numpy as np
+
+        if not isinstance(key,tuple):
+            key = (key,)
+        key = key + (slice(None),)*(4-len(key))
+        yr,mo,la,lo = key
+
+        ### Indices of requested years and months
+        yearq = np.arange(self.shape[0])[yr]
+        monthq = np.arange(12)[mo]
+        yearscalar = np.ndim(yearq) == 0
+        monthscalar = np.ndim(monthq) == 0
+        yearq = np.atleast_1d(yearq)
+        monthq = np.atleast_1d(monthq)
+
+        ### Slice lat/lon on the memmap before pulling months from disk
+        region = np.empty((1,120,360),dtype=bool)[:,la,lo].shape[1:]
+        var = np.empty((yearq.size,monthq.size) + region,dtype='float32')
+        var.fill(np.nan)
+        for i in range(yearq.size):
+            datam = self.data[yearq[i]]
+            avail = monthq < datam.shape[0]
+            var[i,avail] = datam[:,la,lo][monthq[avail]]
+
+        ### Mask out threshold values
+        if self.threshold is not None:
+            var[np.where(var < self.threshold)] = np.nan
+
+        if monthscalar:
+            var = var[:,0]
+        if yearscalar:
+            var = var[0]
+        return var
+
+def memmapPiomas(directory,years,files,threshold):
+    """
+    Function memory-maps PIOMAS binary files into a lazy float32 view
+
+    Parameters
+    ----------
+    directory : string
+        directory of the stored PIOMAS files (including grid.txt)
+    years : integers
+        years for data files
+    files : string
+        file prefix relative to directory (e.g. 'Thickness/heff' or 'area')
+    threshold : float (or None)
+        mask amounts < to this value
+
+    Returns
+    -------
+    lats : 2d array
+        latitudes
+    lons : 2d array
+        longitudes
+    var : PiomasView [year,month,lat,lon]
+        lazy view of the PIOMAS variable
+
+    Usage
+    -----
+    lats,lons,var = memmapPiomas(directory,years,files,threshold)
+    """
+    
+    print('\n>>> Using memmapPiomas function!')
+    
+    ### Import modules
+    import numpy as np
+    import datetime
+    
+    ### Retrieve Grid (cached binary)
+    lats,lons,area,bering = gridPiomas(directory)
     
-    ### Call variables from PIOMAS
-    files = 'heff'
-    directory = directory + 'Thickness/'
+    ### Memory-map each year file without reading it
+    filenames = [directory + files + '_%s.H' % (yr) for yr in years]
+    var = PiomasView(filenames,threshold)
     
-    ### Read data from binary into numpy arrays
-    var = np.empty((len(years),12,120,360))
+    months = var.data[-1].shape[0]
+    name = files.split('/')[-1]
+    if months != 12:
+        month = datetime.date(np.max(years),months,1).strftime('%B')
+        print('%s data available through ---> "%s"' % (name,month))
+        print('%s data available from ---> (%s - %s)' \
+                % (name,np.nanmin(years),np.nanmax(years)))
     
+    return lats,lons,var
+
+def readPiomas(directory,years,threshold):
+    """
+    Function reads PIOMAS binary and converts to standard numpy array.
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored PIOMAS files
+    years : integers
+        years for data files
+    threshold : float
+        mask sea ice thickness amounts < to this value
+
+    Returns
+    -------
+    lats : 2d array
+        latitudes
+    lons : 2d array
+        longitudes
+    var : 4d array [year,month,lat,lon]
+        sea ice thickness (m) 
+
+    Usage
+    -----
+    lats,lons,var = readPiomas(directory,years,threshold)
+    """
+    
+    print('\n>>> Using readPiomas function!\n')
+    
+    ### Read data from memory-mapped binary (float32)
     print('Currently reading PIOMAS data!')
-    for i in range(len(years)):
-        data = np.fromfile(directory + files + '_%s.H' % (years[i]),
-                           dtype = 'float32')
-
-    ### Reshape into [year,month,lat,lon]
-        months = data.shape[0]//(120*360)
-        if months != 12:
-            lastyearq = np.reshape(data,(months,120,360))
-            emptymo = np.empty((12-months,120,360))
-            emptymo[:,:,:] = np.nan
-            lastyear = np.append(lastyearq,emptymo,axis=0)
-            var[i,:,:,:] = lastyear
-            
-            month = datetime.date(yr, months, dy).strftime('%B')
-            print('\nSIT data available through ---> "%s"' % month)
-            print('SIT data available from ---> (%s - %s)' \
-                    % (np.nanmin(years),np.nanmax(years)))
-            
-        elif months == 12:
-            dataq = np.reshape(data,(12,120,360))        
-            var[i,:,:,:] = dataq
-        else:
-            ValueError('Issue with reshaping SIT array from binary')
-    
-    ### Mask out threshold values
-    var[np.where(var < threshold)] = np.nan
+    lats,lons,sit = memmapPiomas(directory,years,'Thickness/heff',threshold)
+    var = sit[:]
     print('\nMasking SIT data < %s m!' % threshold)
 
     print('\n*Completed: Read SIT data!')   
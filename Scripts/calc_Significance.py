@@ -0,0 +1,294 @@
+"""
+Functions test differences between two groups of years for every grid cell
+at once: nan-aware Welch t-tests as array operations, permutation or
+bootstrap tests of the difference of means split across a process pool,
+and false discovery rate (FDR) control for field significance.
+
+Notes
+-----
+    Reference : Wilks, D.S., 2016: "The stippling shows statistically
+                significant grid points". BAMS, 97, 2263-2273
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    ttestWelch(vara,varb)
+    resampleTest(vara,varb,method,nsamples,workers,seed,batch)
+    fdrControl(pvalue,alpha)
+"""
+
+def _flatGroups(vara,varb):
+    """
+    Function flattens two groups [year,...] to float64 [year,cell] with nan
+    as missing
+    """
+
+    ### Import modules
+    import numpy as np
+
+    vara = np.ma.filled(np.ma.asarray(vara,dtype=float),np.nan)
+    varb = np.ma.filled(np.ma.asarray(varb,dtype=float),np.nan)
+    shape = vara.shape[1:]
+    return (np.reshape(vara,(vara.shape[0],-1)),
+            np.reshape(varb,(varb.shape[0],-1)),shape)
+
+def ttestWelch(vara,varb):
+    """
+    Function calculates Welch's t-test (unequal variances, two-sided) for
+    every grid cell (nan are ignored)
+
+    Parameters
+    ----------
+    vara : nd array [year,...]
+        first group of years
+    varb : nd array [year,...]
+        second group of years
+
+    Returns
+    -------
+    t : nd array [...]
+        t statistic (mean of vara - mean of varb)
+    pvalue : nd array [...]
+        two-sided p-value (nan with fewer than 2 values per group or two
+        constant groups with equal means, 0 for constant groups with
+        different means)
+
+    Usage
+    -----
+    t,pvalue = ttestWelch(vara,varb)
+    """
+
+    ### Import modules
+    import numpy as np
+    import scipy.stats as sts
+
+    vara,varb,shape = _flatGroups(vara,varb)
+
+    def moments(var):
+        n = np.sum(np.isfinite(var),axis=0)
+        with np.errstate(invalid='ignore',divide='ignore'):
+            mean = np.nansum(var,axis=0)/n
+            var2 = np.nansum((var - mean)**2,axis=0)/(n - 1)
+        var2[n < 2] = np.nan
+        return n,mean,var2
+
+    na,meana,vara2 = moments(vara)
+    nb,meanb,varb2 = moments(varb)
+
+    ### Welch-Satterthwaite degrees of freedom
+    with np.errstate(invalid='ignore',divide='ignore'):
+        sa = vara2/na
+        sb = varb2/nb
+        t = (meana - meanb)/np.sqrt(sa + sb)
+        df = (sa + sb)**2/(sa**2/(na - 1) + sb**2/(nb - 1))
+    pvalue = 2*sts.t.sf(np.abs(t),df)
+
+    ### Constant groups with different means are certainly different
+    pvalue[(sa + sb == 0) & (meana != meanb)] = 0.
+
+    return np.reshape(t,shape),np.reshape(pvalue,shape)
+
+### Groups shared with the worker processes (set once by the initializer)
+_shared = {}
+
+def _resampleInit(vara,varb,observed,method):
+    """
+    Function stores the groups once per worker process: values with nan
+    as 0, float masks of valid values and the observed difference
+    """
+
+    ### Import modules
+    import numpy as np
+
+    _shared['method'] = method
+    _shared['observed'] = observed
+    for name,var in (('a',vara),('b',varb)):
+        valid = np.isfinite(var)
+        _shared['value' + name] = np.where(valid,var,0.)
+        _shared['valid' + name] = valid.astype(float)
+    if method == 'permutation':
+        _shared['valuetotal'] = np.sum(_shared['valuea'],axis=0) + \
+                                np.sum(_shared['valueb'],axis=0)
+        _shared['validtotal'] = np.sum(_shared['valida'],axis=0) + \
+                                np.sum(_shared['validb'],axis=0)
+
+def _groupMeans(weights,value,valid):
+    """
+    Function calculates nan-aware means of weighted selections of years
+    [resample,year] as two matrix products
+    """
+
+    ### Import modules
+    import numpy as np
+
+    with np.errstate(invalid='ignore',divide='ignore'):
+        return np.dot(weights,value)/np.dot(weights,valid)
+
+def _resampleBatch(args):
+    """
+    Function counts resampled differences of means at least as extreme as
+    the observed difference (used by workers). All resamples of a batch
+    are drawn as one index matrix [resample,year].
+    """
+
+    ### Import modules
+    import numpy as np
+
+    nsamples,seed = args
+    rng = np.random.RandomState(seed)
+    observed = _shared['observed']
+    na = _shared['valuea'].shape[0]
+    nb = _shared['valueb'].shape[0]
+    rows = np.arange(nsamples)[:,np.newaxis]
+
+    if _shared['method'] == 'permutation':
+        ### Shuffle years between the two groups (first na of each
+        ### permutation are group a)
+        order = np.argsort(rng.random_sample((nsamples,na+nb)),axis=1)
+        select = np.zeros((nsamples,na+nb))
+        select[rows,order[:,:na]] = 1.
+        suma = np.dot(select[:,:na],_shared['valuea']) + \
+               np.dot(select[:,na:],_shared['valueb'])
+        counta = np.dot(select[:,:na],_shared['valida']) + \
+                 np.dot(select[:,na:],_shared['validb'])
+        with np.errstate(invalid='ignore',divide='ignore'):
+            diff = suma/counta - (_shared['valuetotal'] - suma) / \
+                   (_shared['validtotal'] - counta)
+            ### Relative tolerance so the observed split counts itself
+            return np.sum(np.abs(diff) >= np.abs(observed)*(1 - 1e-10),
+                          axis=0)
+
+    ### Resample years within each group as counts of draws per year
+    ### (sign changes of the difference are counted for a two-sided test)
+    drawa = np.zeros((nsamples,na))
+    np.add.at(drawa,(rows,rng.randint(0,na,(nsamples,na))),1.)
+    drawb = np.zeros((nsamples,nb))
+    np.add.at(drawb,(rows,rng.randint(0,nb,(nsamples,nb))),1.)
+    diff = _groupMeans(drawa,_shared['valuea'],_shared['valida']) - \
+           _groupMeans(drawb,_shared['valueb'],_shared['validb'])
+    with np.errstate(invalid='ignore'):
+        return np.sum(np.sign(diff) != np.sign(observed),axis=0)
+
+def resampleTest(vara,varb,method='permutation',nsamples=1000,workers=None,
+                 seed=0,batch=100):
+    """
+    Function calculates permutation or bootstrap p-values of the difference
+    of means for every grid cell, with batches of resamples spread across a
+    pool of worker processes (the groups are sent to each worker once)
+
+    Parameters
+    ----------
+    vara : nd array [year,...]
+        first group of years
+    varb : nd array [year,...]
+        second group of years
+    method : string, optional
+        'permutation' (years shuffled between groups) or 'bootstrap' (years
+        resampled within each group)
+    nsamples : integer, optional
+        number of resamples
+    workers : integer, optional
+        number of worker processes (default is the number of cores, 1 runs
+        serially)
+    seed : integer, optional
+        seed of the resampling (results do not depend on workers)
+    batch : integer, optional
+        number of resamples per task (drawn as one index matrix)
+
+    Returns
+    -------
+    diff : nd array [...]
+        difference of means (vara - varb)
+    pvalue : nd array [...]
+        two-sided p-value
+
+    Usage
+    -----
+    diff,pvalue = resampleTest(vara,varb,method,nsamples,workers,seed,batch)
+    """
+
+    print('\n>>> Using resampleTest function!')
+
+    ### Import modules
+    import numpy as np
+    import warnings
+    import multiprocessing as mp
+
+    if method not in ('permutation','bootstrap'):
+        raise ValueError('Unknown method "%s", choose from ' \
+                         '[\'bootstrap\', \'permutation\']' % method)
+
+    vara,varb,shape = _flatGroups(vara,varb)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore',category=RuntimeWarning)
+        observed = np.nanmean(vara,axis=0) - np.nanmean(varb,axis=0)
+
+    ### Independent random streams per batch (seeded by [seed,batch])
+    sizes = [min(batch,nsamples-i) for i in range(0,nsamples,batch)]
+    seeds = [None if seed is None else [seed,i] for i in range(len(sizes))]
+    args = list(zip(sizes,seeds))
+    initargs = (vara,varb,observed,method)
+
+    count = np.zeros(observed.shape,dtype='int64')
+    if workers == 1:
+        _resampleInit(*initargs)
+        for arg in args:
+            count += _resampleBatch(arg)
+        _shared.clear()
+    else:
+        pool = mp.Pool(workers,_resampleInit,initargs)
+        try:
+            for countq in pool.imap_unordered(_resampleBatch,args):
+                count += countq
+        finally:
+            pool.close()
+            pool.join()
+
+    if method == 'permutation':
+        pvalue = (count + 1.)/(nsamples + 1.)
+    else:
+        pvalue = np.minimum(2.*(count + 1.)/(nsamples + 1.),1.)
+    pvalue[~np.isfinite(observed)] = np.nan
+
+    print('*Completed: %s %s resamples!' % (nsamples,method))
+    return np.reshape(observed,shape),np.reshape(pvalue,shape)
+
+def fdrControl(pvalue,alpha=0.05):
+    """
+    Function finds the significant grid cells with the Benjamini-Hochberg
+    false discovery rate procedure (use alpha = 2x the global level for
+    field significance, Wilks 2016)
+
+    Parameters
+    ----------
+    pvalue : nd array
+        p-values of every grid cell (nan are ignored)
+    alpha : float, optional
+        false discovery rate
+
+    Returns
+    -------
+    significant : nd array
+        boolean mask of significant grid cells
+    pcrit : float
+        largest significant p-value (0 if none)
+
+    Usage
+    -----
+    significant,pcrit = fdrControl(pvalue,alpha)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    pvalue = np.asarray(pvalue,dtype=float)
+    valid = np.sort(pvalue[np.isfinite(pvalue)])
+    rank = np.arange(1,valid.shape[0]+1)
+    below = np.where(valid <= alpha*rank/valid.shape[0])[0]
+
+    pcrit = valid[below[-1]] if below.size > 0 else 0.
+    with np.errstate(invalid='ignore'):
+        significant = np.isfinite(pvalue) & (pvalue <= pcrit) & (pcrit > 0)
+
+    return significant,pcrit
@@ -15,6 +15,8 @@ from mpl_toolkits.basemap import Basemap
 import cmocean
 import datetime
 import math
+import calc_IceMask as IM
+import calc_Significance as SG
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice_obs/SIC_Alaska/' 
@@ -43,6 +45,9 @@ data.close()
 
 print('Completed: Data read!')
 
+### Keep open water as 0% for the statistics
+sic = ice.copy()
+
 ### Mask values below 20%
 ice[np.where(ice<0.01)]=np.nan
 
@@ -56,6 +61,15 @@ yearnewq = np.where((years>=1979) & (years<=2017))[0]
 iceold = np.nanmean(ice[yearoldq,:,:],axis=0)
 icenew = np.nanmean(ice[yearnewq,:,:],axis=0)
 
+### Frequency of SIC >= 15% in each baseline (bit-packed masks)
+icemask = IM.IceMask(sic,np.arange(1850,1850+ice.shape[0],1),15)
+freqold = icemask.frequency(years[yearoldq])
+freqnew = icemask.frequency(years[yearnewq])
+
+### Significance of the baseline difference (Welch t-test, FDR of 0.10)
+tstat,pvalue = SG.ttestWelch(sic[yearnewq,:,:],sic[yearoldq,:,:])
+significant,pcrit = SG.fdrControl(pvalue,0.10)
+
 ###############################################################################
 ###############################################################################
 ###############################################################################
@@ -114,8 +128,8 @@ m.drawmapboundary(color='k')
 m.drawlsmask(land_color='k',ocean_color='k')
 
 cs = m.contourf(lon2,lat2,iceold,np.arange(0,101,2),latlon=True)
-#cs1 = m.contour(lon2,lat2,iceold,np.arange(15,20,5),latlon=True,colors='m',
-#               linewidths=1)
+cs1 = m.contour(lon2,lat2,freqold,[0.5],latlon=True,colors='m',
+                linewidths=1)
 cs2 = m.contour(lon2,lat2,ice[-1,:,:],np.arange(15,20,5),latlon=True,colors='r',
                 linewidths=2)
 
@@ -136,10 +150,12 @@ m.drawmapboundary(color='k')
 m.drawlsmask(land_color='k',ocean_color='k')
 
 cs = m.contourf(lon2,lat2,icenew,np.arange(0,101,2),latlon=True)
-#cs1 = m.contour(lon2,lat2,icenew,np.arange(15,20,5),latlon=True,colors='m',
-#               linewidths=1)
+cs1 = m.contour(lon2,lat2,freqnew,[0.5],latlon=True,colors='m',
+                linewidths=1)
 cs2 = m.contour(lon2,lat2,ice[-1,:,:],np.arange(15,20,5),latlon=True,colors='r',
                 linewidths=2)
+cs3 = m.contourf(lon2,lat2,significant.astype(float),[0.5,1.5],
+                 colors='none',hatches=['....'],latlon=True)
 
 cmap = cmocean.cm.dense_r     
 cs.set_cmap(cmap)
@@ -166,6 +182,12 @@ ax1.annotate(r'\textbf{1979--2017}',
 ax1.annotate(r'\textbf{2018 -- Red}',
             xy=(0, 0),xytext=(0.51,0.75),xycoords='figure fraction',
             fontsize=9,color='r',rotation=0,ha='center',va='center')
+ax1.annotate(r'\textbf{Ice in 50\% of Years -- Magenta}',
+            xy=(0, 0),xytext=(0.51,0.72),xycoords='figure fraction',
+            fontsize=9,color='m',rotation=0,ha='center',va='center')
+ax1.annotate(r'\textbf{Stippling -- Significant Difference (FDR 0.10)}',
+            xy=(0, 0),xytext=(0.51,0.69),xycoords='figure fraction',
+            fontsize=9,color='darkgrey',rotation=0,ha='center',va='center')
           
 fig.subplots_adjust(hspace=-0.6)
 
@@ -15,6 +15,12 @@ from mpl_toolkits.basemap import Basemap
 import cmocean
 import datetime
 import math
+import calc_IceMask as IM
+import calc_Significance as SG
+import calc_Climatology as CL
+import calc_Analogs as CA
+import calc_GridArea as GA
+import calc_SeaIceExtent as CE
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice_obs/SIC_Alaska/' 
@@ -43,21 +49,41 @@ data.close()
 
 print('Completed: Data read!')
 
+### Keep open water as 0% for the statistics
+sic = ice.copy()
+
 ### Mask values below 20%
 ice[np.where(ice<0.01)]=np.nan
 
 ### Meshgrid
 lon2,lat2 = np.meshgrid(lon1,lat1)
 
-### Analogs
-analogs = np.array([1951,1959,1989,2003,2009,2010,2015,2017])
+### Analogs (8 closest years to 2018 in the Bering Sea, area-weighted RMSE)
+analogindex = CA.AnalogIndex(sic,years,GA.gridArea('atlas',lat1,lon1),
+                             CE.regionBering(lat1,lon1,67))
+analogs,distance = analogindex.query(sic[-1],8,'rmse',exclude=[2018])
+analogs = np.sort(analogs)
 yearoldq = np.searchsorted(years,analogs)
+print('Analogs of 2018 ---> %s' % analogs.tolist())
 
-### Baselines
-yearnewq = np.where((years>=1979) & (years<=2017))[0]
+### Baselines (prefix sums over the years)
+index = CL.YearIndex(ice,years)
 
 iceold = np.nanmean(ice[yearoldq,:,:],axis=0)
-icenew = np.nanmean(ice[yearnewq,:,:],axis=0)
+icenew = index.mean(1979,2017)
+
+### Frequency of SIC >= 15% in each group of years (bit-packed masks)
+icemask = IM.IceMask(sic,years,15)
+freqold = icemask.frequency(analogs)
+freqnew = icemask.frequency(np.arange(1979,2017+1,1))
+
+### Significance of analogs minus 1979-2017 (Welch t-test, FDR of 0.10),
+### analog years are left out of 1979-2017 so the groups are independent
+yearnewq = np.setdiff1d(np.arange(np.searchsorted(years,1979),
+                                  np.searchsorted(years,2017,'right')),
+                        yearoldq)
+tstat,pvalue = SG.ttestWelch(sic[yearoldq,:,:],sic[yearnewq,:,:])
+significant,pcrit = SG.fdrControl(pvalue,0.10)
 
 ###############################################################################
 ###############################################################################
@@ -117,10 +143,12 @@ m.drawmapboundary(color='k')
 m.drawlsmask(land_color='k',ocean_color='k')
 
 cs = m.contourf(lon2,lat2,iceold,np.arange(0,101,2),latlon=True)
-#cs1 = m.contour(lon2,lat2,iceold,np.arange(15,20,5),latlon=True,colors='m',
-#               linewidths=1)
+cs1 = m.contour(lon2,lat2,freqold,[0.5],latlon=True,colors='m',
+                linewidths=1)
 cs2 = m.contour(lon2,lat2,ice[-1,:,:],np.arange(15,20,5),latlon=True,colors='r',
                 linewidths=2)
+cs3 = m.contourf(lon2,lat2,significant.astype(float),[0.5,1.5],
+                 colors='none',hatches=['....'],latlon=True)
 
 cmap = cmocean.cm.dense_r     
 cs.set_cmap(cmap)
@@ -130,7 +158,7 @@ m.fillcontinents(color='k')
 ax.annotate(r'\textbf{ANALOGS}',
             xy=(0, 0),xytext=(0.5,1.02),xycoords='axes fraction',
             fontsize=25,color='darkgrey',rotation=0,ha='center',va='center')
-ax.annotate(r'\textbf{1951,1959,1989,2003,2009,2010,2015,2017}',
+ax.annotate(r'\textbf{%s}' % ','.join(map(str,analogs)),
             xy=(0, 0),xytext=(0.5,0.1),xycoords='axes fraction',
             fontsize=7,color='darkgrey',rotation=0,ha='center',va='center')
 
@@ -142,8 +170,8 @@ m.drawmapboundary(color='k')
 m.drawlsmask(land_color='k',ocean_color='k')
 
 cs = m.contourf(lon2,lat2,icenew,np.arange(0,101,2),latlon=True)
-#cs1 = m.contour(lon2,lat2,icenew,np.arange(15,20,5),latlon=True,colors='m',
-#               linewidths=1)
+cs1 = m.contour(lon2,lat2,freqnew,[0.5],latlon=True,colors='m',
+                linewidths=1)
 cs2 = m.contour(lon2,lat2,ice[-1,:,:],np.arange(15,20,5),latlon=True,colors='r',
                 linewidths=2)
 
@@ -168,6 +196,12 @@ ax1.annotate(r'\textbf{1979--2017}',
 ax1.annotate(r'\textbf{2018 -- Red}',
             xy=(0, 0),xytext=(0.51,0.75),xycoords='figure fraction',
             fontsize=9,color='r',rotation=0,ha='center',va='center')
+ax1.annotate(r'\textbf{Ice in 50\% of Years -- Magenta}',
+            xy=(0, 0),xytext=(0.51,0.72),xycoords='figure fraction',
+            fontsize=9,color='m',rotation=0,ha='center',va='center')
+ax1.annotate(r'\textbf{Stippling -- Significant Difference (FDR 0.10)}',
+            xy=(0, 0),xytext=(0.51,0.69),xycoords='figure fraction',
+            fontsize=9,color='darkgrey',rotation=0,ha='center',va='center')
           
 fig.subplots_adjust(hspace=-0.6)
 
@@ -12,6 +12,7 @@ import numpy as np
 from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 import datetime
+import read_SeriesStore as RS
 import statsmodels.api as sm
 
 ### Define directories
@@ -33,8 +34,8 @@ years = np.arange(1850,2019+1,1)
 yearsat = np.arange(1979,2019+1,1)
 
 #### Retrieve data from NSIDC regional extent in Bering Sea
-beringold = np.genfromtxt(directorydata2 + 'BeringSeaIce_NSIDC_Feb.txt')
-bering = beringold/1e6
+store = RS.readStore(directorydata2)
+bering = store.query('nsidc','bering','extent',2,yearsat)
 
 ### Retrieve data from historical sea ice atlas
 filename = directorydata + 'Alaska_SIC_Feb_1850-2019.nc'
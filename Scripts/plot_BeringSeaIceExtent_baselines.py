@@ -13,7 +13,9 @@ import numpy as np
 from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 import datetime
+import read_SeriesStore as RS
 import scipy.stats as sts
+import calc_Climatology as CL
 
 ### Define directories
 directorydata2 = '/home/zlabe/Documents/Projects/BeringSeaIce2018/Data/'
@@ -33,19 +35,18 @@ years = np.arange(1850,2018+1,1)
 yearsat = np.arange(1979,2018+1,1)
 
 ### Retrieve data from NSIDC regional extent in Bering Sea
-ice = np.genfromtxt(directorydata2 + 'Bering_SIE_iceatlas_' \
-                          '02_1850-2018.txt',skip_header=1)
+store = RS.readStore(directorydata2)
+ice = store.query('atlas','bering','extent',2,years)
 
 ### Rank data
 rank = sts.rankdata(ice[:-1],method='min')
 maxq = ice[np.where(rank==np.max(rank))[0]]
 minq = ice[np.where(rank==np.min(rank))[0]]
 
-yearq = np.where((years>=1979) & (years<=2017))[0]
-icebase = np.nanmean(ice[yearq],axis=0)
-
-yearqq = np.where((years>=1942) & (years<=1978))[0]
-oldicebase = np.nanmean(ice[yearqq],axis=0)
+### Baselines from prefix sums over the years
+index = CL.YearIndex(ice,years)
+icebase = index.mean(1979,2017)
+oldicebase = index.mean(1942,1978)
 
 ice18 = ice[-1]
 
@@ -12,6 +12,7 @@ Notes
 import numpy as np
 import matplotlib.pyplot as plt
 import datetime
+import read_SeriesStore as RS
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice_obs/SIC_Alaska/' 
@@ -32,13 +33,11 @@ years = np.arange(1850,2018+1,1)
 yearsat = np.arange(1979,2018+1,1)
 
 ### Retrieve data from NSIDC regional extent in Bering Sea
-beringold = np.genfromtxt(directorydata2 + 'BeringSeaIceExtent_NSIDC_' \
-                       'regional_02_1979-2018.txt')
-bering = (beringold/1e6)*0.386102
+store = RS.readStore(directorydata2)
+bering = store.query('nsidc','bering','extent',2,yearsat)*0.386102
 
-### Retrieve data from NSIDC regional extent in Bering Sea
-ext = np.genfromtxt(directorydata2 + 'Bering_SIE_iceatlas_' \
-                          '02_1850-2018.txt',skip_header=1)
+### Retrieve data from historical sea ice atlas in Bering Sea
+ext = store.query('atlas','bering','extent',2,years)
 ext = (ext*0.386102)*1e6
 
 ###############################################################################
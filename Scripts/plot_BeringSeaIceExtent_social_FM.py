@@ -12,6 +12,7 @@ Notes
 import numpy as np
 import matplotlib.pyplot as plt
 import datetime
+import read_SeriesStore as RS
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice_obs/SIC_Alaska/' 
@@ -32,17 +33,15 @@ years = np.arange(1850,2018+1,1)
 yearsat = np.arange(1979,2018+1,1)
 
 ### Retrieve data from NSIDC regional extent in Bering Sea
-beringfeb = np.genfromtxt(directorydata2 + 'BeringSeaIce_NSIDC_Feb.txt')
-beringmar = np.genfromtxt(directorydata2 + 'BeringSeaIce_NSIDC_Mar.txt')
+store = RS.readStore(directorydata2)
+beringfeb = store.query('nsidc','bering','extent',2,yearsat)
+beringmar = store.query('nsidc','bering','extent',3,yearsat)
 
-beringold = (beringfeb + beringmar)/2
-bering = beringold/1e6
+bering = (beringfeb + beringmar)/2
 
-### Retrieve data from NSIDC regional extent in Bering Sea
-feb = np.genfromtxt(directorydata2 + 'Bering_SIE_iceatlas_' \
-                          '02_1850-2018.txt',skip_header=1)
-mar = np.genfromtxt(directorydata2 + 'Bering_SIE_iceatlas_' \
-                          '03_1850-2018.txt',skip_header=1)
+### Retrieve data from historical sea ice atlas in Bering Sea
+feb = store.query('atlas','bering','extent',2,years)
+mar = store.query('atlas','bering','extent',3,years)
 ext = (feb + mar)/2
 
 ###############################################################################
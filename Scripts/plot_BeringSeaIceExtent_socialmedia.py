@@ -12,6 +12,7 @@ Notes
 import numpy as np
 import matplotlib.pyplot as plt
 import datetime
+import read_SeriesStore as RS
 
 ### Define directories
 directorydata = '/surtsey/zlabe/seaice_obs/SIC_Alaska/' 
@@ -37,10 +38,9 @@ yearsat = np.arange(1979,2019+1,1)
 #bering = beringold/1e6
 
 ### Retrieve data from NSIDC regional extent in Bering Sea
-ext2 = np.genfromtxt(directorydata2 + 'Bering_SIE_iceatlas_' \
-                          '02_1850-2019.txt',skip_header=1)
-ext3 = np.genfromtxt(directorydata2 + 'Bering_SIE_iceatlas_' \
-                          '03_1850-2019.txt',skip_header=1)
+store = RS.readStore(directorydata2)
+ext2 = store.query('atlas','bering','extent',2,years)
+ext3 = store.query('atlas','bering','extent',3,years)
 ext = (ext2 + ext3)/2.
 
 ###############################################################################
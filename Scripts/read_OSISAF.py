@@ -0,0 +1,184 @@
+"""
+Functions read daily OSISAF sea ice concentration files (10 km). The monthly
+mean is accumulated one day at a time so memory stays at one field.
+Masked, non-finite and -999 values are missing.
+
+Notes
+-----
+    Source : http://osisaf.met.no/p/ice/
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    filesOSISAF(directory,year,month)
+    meanOSISAF(filenames)
+    dailyOSISAF(filenames)
+"""
+
+def filesOSISAF(directory,year,month):
+    """
+    Function lists the daily OSISAF files (e.g. mar_2019_1.nc) for every
+    day of a month
+
+    Parameters
+    ----------
+    directory : string
+        directory of the stored daily files
+    year : integer
+        year of the files
+    month : integer
+        calendar month (1-12)
+
+    Returns
+    -------
+    filenames : list
+        daily filenames for the full length of the month
+
+    Usage
+    -----
+    filenames = filesOSISAF(directory,year,month)
+    """
+
+    ### Import modules
+    import calendar as cal
+
+    mon = cal.month_abbr[month].lower()
+    days = range(1,cal.monthrange(year,month)[1]+1)
+    filenames = [directory + '%s_%s_%s.nc' % (mon,year,day) for day in days]
+
+    return filenames
+
+def _validOSISAF(sic):
+    """
+    Function splits a daily field into its data and a mask of valid values
+    (masked, non-finite and -999 values are missing)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    valid = ~np.ma.getmaskarray(sic)
+    sic = np.ma.getdata(sic)
+    valid &= (sic != -999) & np.isfinite(sic)
+    return sic,valid
+
+def meanOSISAF(filenames):
+    """
+    Function calculates the mean SIC over daily OSISAF files using running
+    sum and count arrays (-999 and masked values are missing)
+
+    Parameters
+    ----------
+    filenames : list
+        daily filenames (missing files are skipped)
+
+    Returns
+    -------
+    lat : 2d array
+        latitudes
+    lon : 2d array
+        longitudes
+    sicmean : 2d array [y,x]
+        mean sea ice concentration (%), nan where no day is valid
+
+    Usage
+    -----
+    lat,lon,sicmean = meanOSISAF(filenames)
+    """
+
+    print('\n>>> Using meanOSISAF function!')
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+    import os
+
+    total = None
+    days = 0
+    for filename in filenames:
+        if not os.path.exists(filename):
+            print('Missing file ---> %s' % filename)
+            continue
+
+        data = Dataset(filename,'r')
+        sic = np.squeeze(data.variables['ice_conc'][:])
+        if total is None:
+            lat = data.variables['lat'][:]
+            lon = data.variables['lon'][:]
+            total = np.zeros(sic.shape)
+            count = np.zeros(sic.shape,dtype='int32')
+        data.close()
+
+        ### Update running sum and count with valid values only
+        sic,valid = _validOSISAF(sic)
+        total[valid] += sic[valid]
+        count += valid
+        days += 1
+
+    if total is None:
+        raise ValueError('No OSISAF files found!')
+
+    sicmean = np.empty(total.shape)
+    sicmean.fill(np.nan)
+    np.divide(total,count,out=sicmean,where=count > 0)
+
+    print('*Completed: Averaged %s days of OSISAF data!' % days)
+    return lat,lon,sicmean
+
+def dailyOSISAF(filenames):
+    """
+    Function reads daily OSISAF files into one [day,y,x] array with nan as
+    missing (days with a missing file are all nan)
+
+    Parameters
+    ----------
+    filenames : list
+        daily filenames (missing files are skipped)
+
+    Returns
+    -------
+    lat : 2d array
+        latitudes
+    lon : 2d array
+        longitudes
+    sicday : 3d array [day,y,x]
+        daily sea ice concentration (%)
+
+    Usage
+    -----
+    lat,lon,sicday = dailyOSISAF(filenames)
+    """
+
+    print('\n>>> Using dailyOSISAF function!')
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+    import os
+
+    sicday = None
+    days = 0
+    for i,filename in enumerate(filenames):
+        if not os.path.exists(filename):
+            print('Missing file ---> %s' % filename)
+            continue
+
+        data = Dataset(filename,'r')
+        sic = np.squeeze(data.variables['ice_conc'][:])
+        if sicday is None:
+            lat = data.variables['lat'][:]
+            lon = data.variables['lon'][:]
+            sicday = np.full((len(filenames),) + sic.shape,np.nan,
+                             dtype='float32')
+        data.close()
+
+        sic,valid = _validOSISAF(sic)
+        sicday[i][valid] = sic[valid]
+        days += 1
+
+    if sicday is None:
+        raise ValueError('No OSISAF files found!')
+
+    print('*Completed: Read %s days of OSISAF data!' % days)
+    return lat,lon,sicday
@@ -0,0 +1,175 @@
+"""
+Functions read monthly sea ice concentration from the SNAP Historical Sea Ice
+Atlas (University of Alaska) netCDF4 files. Only the requested calendar months
+and lat/lon sub-box are read from disk using strided hyperslabs.
+
+Notes
+-----
+    Source : http://seaiceatlas.snap.uaf.edu/
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    boxAtlas(lat1,lon1,latmin,latmax,lonmin,lonmax)
+    yearsAtlas(filename,month)
+    readAtlas(filename,months,latmin,latmax,lonmin,lonmax)
+"""
+
+def boxAtlas(lat1,lon1,latmin,latmax,lonmin,lonmax):
+    """
+    Function finds the index slices of a lat/lon sub-box on the atlas grid
+
+    Parameters
+    ----------
+    lat1 : 1d array
+        latitudes
+    lon1 : 1d array
+        longitudes
+    latmin,latmax : float (or None)
+        latitude bounds of the box (degrees)
+    lonmin,lonmax : float (or None)
+        longitude bounds of the box (degrees)
+
+    Returns
+    -------
+    slat : slice
+        index slice along latitude
+    slon : slice
+        index slice along longitude
+
+    Usage
+    -----
+    slat,slon = boxAtlas(lat1,lon1,latmin,latmax,lonmin,lonmax)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    def bounds(coord,cmin,cmax):
+        keep = np.ones(coord.shape,dtype=bool)
+        if cmin is not None:
+            keep &= coord >= cmin
+        if cmax is not None:
+            keep &= coord <= cmax
+        index = np.where(keep)[0]
+        if index.size == 0:
+            raise ValueError('No grid points within (%s - %s)!' % (cmin,cmax))
+        return slice(index.min(),index.max()+1)
+
+    slat = bounds(np.asarray(lat1),latmin,latmax)
+    slon = bounds(np.asarray(lon1),lonmin,lonmax)
+
+    return slat,slon
+
+def yearsAtlas(filename,month):
+    """
+    Function finds the years of one calendar month in a SNAP sea ice atlas
+    file (only the time variable is read)
+
+    Parameters
+    ----------
+    filename : string
+        path of the atlas netCDF4 file
+    month : integer
+        calendar month (1-12)
+
+    Returns
+    -------
+    years : 1d array
+        years of readAtlas(filename,month)
+
+    Usage
+    -----
+    years = yearsAtlas(filename,month)
+    """
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset, num2date
+
+    data = Dataset(filename)
+    time = data.variables['time']
+    first = num2date(time[0],time.units)
+    ntime = time.shape[0]
+    data.close()
+
+    start = (month - first.month) % 12
+    year0 = first.year + (first.month - 1 + start)//12
+    years = year0 + np.arange(len(range(start,ntime,12)))
+
+    return years
+
+def readAtlas(filename,months,latmin=None,latmax=None,
+              lonmin=None,lonmax=None):
+    """
+    Function reads only the requested calendar months from a SNAP sea ice
+    atlas file (e.g. SNAP_SEA_ICE_ATLAS_MAR.nc)
+
+    Parameters
+    ----------
+    filename : string
+        path of the atlas netCDF4 file
+    months : integer or list of integers
+        calendar months (1-12) to read
+    latmin,latmax : float, optional
+        latitude bounds of a sub-box (degrees)
+    lonmin,lonmax : float, optional
+        longitude bounds of a sub-box (degrees)
+
+    Returns
+    -------
+    lat1 : 1d array
+        latitudes
+    lon1 : 1d array
+        longitudes
+    ice : 3d array [year,lat,lon] or 4d array [year,month,lat,lon]
+        sea ice concentration (%), 3d if a single month is requested (years
+        of yearsAtlas), else row i is the year of the first time step + i
+        with months outside the record masked
+
+    Usage
+    -----
+    lat1,lon1,ice = readAtlas(filename,months,latmin,latmax,lonmin,lonmax)
+    """
+
+    print('\n>>> Using readAtlas function!')
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset, num2date
+
+    monthq = np.atleast_1d(months)
+
+    data = Dataset(filename)
+    lat1 = data.variables['lat'][:]
+    lon1 = data.variables['lon'][:]
+    slat,slon = boxAtlas(lat1,lon1,latmin,latmax,lonmin,lonmax)
+
+    ### Calendar month of the first time step
+    time = data.variables['time']
+    month0 = num2date(time[0],time.units).month
+
+    ### Read each month as a strided hyperslab [start::12]
+    sic = data.variables['sic_con_pct']
+    icemo = []
+    for mo in monthq:
+        start = (mo - month0) % 12
+        icemo.append(sic[start::12,slat,slon])
+    data.close()
+
+    if monthq.size == 1 and np.ndim(months) == 0:
+        ice = icemo[0]
+    else:
+        ### Row i is the year of the first time step + i, so months before
+        ### month0 start one row late (missing first year) and months
+        ### missing in a partial final year are padded at the end
+        offset = [int(mo < month0) for mo in monthq]
+        nyears = max([off + item.shape[0] for off,item in zip(offset,icemo)])
+        ice = np.ma.masked_all((nyears,monthq.size) + icemo[0].shape[1:],
+                               dtype=icemo[0].dtype)
+        for i in range(monthq.size):
+            ice[offset[i]:offset[i]+icemo[i].shape[0],i,:,:] = icemo[i]
+
+    print('*Completed: Read atlas months %s!' % monthq.tolist())
+    return lat1[slat],lon1[slon],ice
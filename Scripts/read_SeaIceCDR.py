@@ -0,0 +1,150 @@
+"""
+Functions read the NOAA/NSIDC CDRv3 monthly sea ice concentration files. The
+directory is scanned once into a (year,month) catalog and the files are read
+concurrently into a preallocated float32 (or compact uint8) cube.
+
+Notes
+-----
+    Source : https://nsidc.org/data/g02202
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    catalogCDR(directory)
+    readCDR(directory,years,workers,compact)
+"""
+
+def catalogCDR(directory):
+    """
+    Function scans a directory for seaice_conc_monthly_nh_<sat>_<YYYYMM>
+    files and maps each month to its file
+
+    Parameters
+    ----------
+    directory : string
+        directory of the stored CDRv3 monthly files
+
+    Returns
+    -------
+    catalog : dictionary
+        (year,month) -> filename (sensor is taken from the filename)
+
+    Usage
+    -----
+    catalog = catalogCDR(directory)
+    """
+
+    ### Import modules
+    import os
+    import re
+
+    pattern = re.compile(r'seaice_conc_monthly_nh_(\w+?)_(\d{4})(\d{2})_' \
+                         r'v03r01\.nc$')
+
+    catalog = {}
+    for filename in sorted(os.listdir(directory)):
+        match = pattern.match(filename)
+        if match is None:
+            continue
+        key = (int(match.group(2)),int(match.group(3)))
+        if key in catalog:
+            print('Duplicate CDRv3 files for %s/%s, using ---> %s' \
+                  % (key[1],key[0],catalog[key]))
+            continue
+        catalog[key] = filename
+
+    return catalog
+
+def _readFileCDR(filename,compact=False):
+    """
+    Function reads one CDRv3 monthly file as float32 or compact uint8
+    percent (used by workers)
+    """
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+    import calc_CompactSIC as CS
+
+    data = Dataset(filename)
+    sic = data.variables['seaice_conc_monthly_cdr'][:]
+    data.close()
+
+    if compact:
+        return np.squeeze(CS.packSIC(sic,100.))
+    sic = np.ma.filled(np.ma.asarray(sic,dtype='float32'),np.nan)
+    return np.squeeze(sic)
+
+def readCDR(directory,years,workers=None,compact=False):
+    """
+    Function reads CDRv3 monthly sea ice concentration into [year,month,y,x]
+    using a pool of worker processes. Months without a file are nan.
+
+    Parameters
+    ----------
+    directory : string
+        directory of the stored CDRv3 monthly files
+    years : 1d array
+        years to read
+    workers : integer, optional
+        number of worker processes (default is the number of cores)
+    compact : boolean, optional
+        return uint8 percent with flags and missing months as 255 (see
+        calc_CompactSIC)
+
+    Returns
+    -------
+    lat : 2d array
+        latitudes
+    lon : 2d array
+        longitudes
+    sic : 4d array [year,month,y,x]
+        sea ice concentration (fraction, flag values are unchanged), or
+        compact uint8 percent
+
+    Usage
+    -----
+    lat,lon,sic = readCDR(directory,years,workers,compact)
+    """
+
+    print('\n>>> Using readCDR function!')
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+    import calc_CompactSIC as CS
+
+    ### Match requested months to files
+    catalog = catalogCDR(directory)
+    keys = [(i,j) for i in range(len(years)) for j in range(12)
+            if (years[i],j+1) in catalog]
+    filenames = [directory + catalog[(years[i],j+1)] for i,j in keys]
+    if len(filenames) == 0:
+        raise ValueError('No CDRv3 files found for (%s - %s)!' \
+                         % (np.min(years),np.max(years)))
+
+    missing = len(years)*12 - len(keys)
+    if missing > 0:
+        print('Missing %s months of CDRv3 data (set to missing)!' % missing)
+
+    ### Grid from the first file
+    data = Dataset(filenames[0])
+    lat = data.variables['latitude'][:]
+    lon = data.variables['longitude'][:]
+    data.close()
+
+    ### Read files concurrently into a preallocated cube
+    if compact:
+        sic = np.full((len(years),12) + lat.shape,CS.missing,dtype='uint8')
+    else:
+        sic = np.full((len(years),12) + lat.shape,np.nan,dtype='float32')
+    reader = partial(_readFileCDR,compact=compact)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for (i,j),var in zip(keys,pool.map(reader,filenames,chunksize=12)):
+            sic[i,j,:,:] = var
+
+    print('*Completed: Read %s CDRv3 files!' % len(filenames))
+    return lat,lon,sic
@@ -0,0 +1,209 @@
+"""
+Functions read the Sea Ice Index regional daily and monthly workbooks
+(G02135 v3.0). Every sheet (all regions, extent and area) is parsed once into
+a binary cache of .npy columns next to the workbook (sii_cache/, ignored by
+git), which is rebuilt when the size or modification time of the workbook
+changes. Later reads are memory-mapped.
+
+Notes
+-----
+    Source : ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/seaice_analysis/
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    cacheIndex(filename,cachedir)
+    readDaily(filename,region,variable,cachedir)
+    readMonthly(filename,region,variable,cachedir)
+"""
+
+def _sheetKey(sheet):
+    """
+    Cache name of a sheet, e.g. 'East-Siberian-Extent-km^2' is
+    'eastsiberian_extent' (region names as in calc_RegionMask)
+    """
+    parts = sheet.split('-')
+    region = ''.join(parts[:-2]).lower()
+    variable = parts[-2].lower()
+    return '%s_%s' % (region,variable)
+
+def cacheIndex(filename,cachedir=None):
+    """
+    Function converts every sheet of a regional workbook to .npy columns
+    (only when the cache is missing or the workbook changed)
+
+    Parameters
+    ----------
+    filename : string
+        path of the daily or monthly regional workbook (.xlsx)
+    cachedir : string, optional
+        directory for the cache (default is next to the workbook)
+
+    Returns
+    -------
+    cachedir : string
+        directory of the current cache
+
+    Usage
+    -----
+    cachedir = cacheIndex(filename,cachedir)
+    """
+
+    ### Import modules
+    import numpy as np
+    import pandas as pd
+    import os
+
+    if cachedir is None:
+        name = os.path.splitext(os.path.basename(filename))[0]
+        cachedir = os.path.join(os.path.dirname(os.path.abspath(filename)),
+                                'sii_cache',name)
+    source = os.stat(filename)
+    key = '%s %s' % (source.st_size,source.st_mtime_ns)
+
+    keyfile = os.path.join(cachedir,'source.txt')
+    if os.path.exists(keyfile):
+        with open(keyfile) as f:
+            if f.read().strip() == key:
+                return cachedir
+
+    print('Building Sea Ice Index cache for %s!' % os.path.basename(filename))
+
+    ### Parse all sheets in one pass over the workbook (the sheet argument
+    ### is positional, it was renamed sheetname -> sheet_name in pandas 0.21)
+    sheets = pd.read_excel(filename,None,header=None)
+    os.makedirs(cachedir,exist_ok=True)
+    if os.path.exists(keyfile):
+        os.remove(keyfile)
+
+    ### Axes shared by every sheet are written once
+    axes = {}
+    for sheet,df in sheets.items():
+        if sheet == 'Documentation':
+            continue
+        values = df.values
+        field = _sheetKey(sheet)
+
+        if str(values[0,0]).strip().lower() == 'month':
+            ### Daily layout: month, day, then one column per year
+            if not axes:
+                monthname = pd.Series(values[1:,0]).ffill().values
+                month = [pd.Timestamp('%s 1 2000' % mo).month \
+                         for mo in monthname]
+                axes['years'] = values[0,2:].astype(int)
+                axes['month'] = np.array(month,dtype='int8')
+                axes['day'] = values[1:,1].astype('int8')
+            data = values[1:,2:].astype(float)
+        else:
+            ### Monthly layout: years in rows, (value,rank) per month
+            if not axes:
+                axes['years'] = values[3:,0].astype(int)
+            data = values[3:,1:25:2].astype(float)
+            rank = values[3:,2:25:2].astype(float)
+            np.save(os.path.join(cachedir,'%s_rank.npy' % field),rank)
+        np.save(os.path.join(cachedir,'%s.npy' % field),data)
+
+    for axis,var in axes.items():
+        np.save(os.path.join(cachedir,'%s.npy' % axis),var)
+
+    ### Write key last so a partial cache is never used
+    with open(keyfile,'w') as f:
+        f.write(key)
+
+    return cachedir
+
+def readDaily(filename,region,variable='extent',cachedir=None):
+    """
+    Function reads a region of the daily regional workbook (cached)
+
+    Parameters
+    ----------
+    filename : string
+        path of Sea_Ice_Index_Regional_Daily_Data_G02135_v3.0.xlsx
+    region : string
+        region name (e.g. 'bering', 'eastsiberian')
+    variable : string, optional
+        'extent' or 'area'
+    cachedir : string, optional
+        directory for the cache
+
+    Returns
+    -------
+    years : 1d array [year]
+        years of the columns
+    month : 1d array [doy]
+        month of each row
+    day : 1d array [doy]
+        day of month of each row
+    data : 2d array [doy,year]
+        daily sea ice extent or area (km^2), read-only
+
+    Usage
+    -----
+    years,month,day,data = readDaily(filename,region,variable,cachedir)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+
+    cachedir = cacheIndex(filename,cachedir)
+    field = os.path.join(cachedir,'%s_%s.npy' % (region.lower(),
+                                                 variable.lower()))
+    if not os.path.exists(field):
+        raise ValueError('No %s sheet for region "%s" in %s' \
+                         % (variable,region,filename))
+
+    years = np.load(os.path.join(cachedir,'years.npy'))
+    month = np.load(os.path.join(cachedir,'month.npy'))
+    day = np.load(os.path.join(cachedir,'day.npy'))
+    data = np.load(field,mmap_mode='r')
+
+    return years,month,day,data
+
+def readMonthly(filename,region,variable='extent',cachedir=None):
+    """
+    Function reads a region of the monthly regional workbook (cached)
+
+    Parameters
+    ----------
+    filename : string
+        path of Sea_Ice_Index_Regional_Monthly_Data_G02135_v3.0.xlsx
+    region : string
+        region name (e.g. 'bering', 'eastsiberian')
+    variable : string, optional
+        'extent' or 'area'
+    cachedir : string, optional
+        directory for the cache
+
+    Returns
+    -------
+    years : 1d array [year]
+        years of the rows
+    data : 2d array [year,month]
+        monthly sea ice extent or area (km^2), read-only
+    rank : 2d array [year,month]
+        rank of each year within its month, read-only
+
+    Usage
+    -----
+    years,data,rank = readMonthly(filename,region,variable,cachedir)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+
+    cachedir = cacheIndex(filename,cachedir)
+    field = os.path.join(cachedir,'%s_%s' % (region.lower(),
+                                             variable.lower()))
+    if not os.path.exists(field + '.npy'):
+        raise ValueError('No %s sheet for region "%s" in %s' \
+                         % (variable,region,filename))
+
+    years = np.load(os.path.join(cachedir,'years.npy'))
+    data = np.load(field + '.npy',mmap_mode='r')
+    rank = np.load(field + '_rank.npy',mmap_mode='r')
+
+    return years,data,rank
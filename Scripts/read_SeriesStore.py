@@ -0,0 +1,249 @@
+"""
+Functions build and query one indexed store of monthly sea ice series
+(source, region, variable, month, year) -> value (10^6 km^2). The store
+combines the Sea Ice Index regional monthly workbook (all regions, extent
+and area), the hand-exported NSIDC Bering text files (years beyond the
+workbook) and the ice atlas extent series, and is saved as one .npz
+(series_store.npz, ignored by git) that is rebuilt whenever any of these
+files change.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    buildStore(directory,filename)
+    readStore(directory,filename)
+    SeriesStore(filename)
+"""
+
+### Source files of the store (relative to the data directory)
+workbook = 'Sea_Ice_Index_Regional_Monthly_Data_G02135_v3.0.xlsx'
+monthnames = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct',
+              'Nov','Dec']
+
+def _sourceFiles(directory):
+    """
+    Function lists the text series in the data directory as
+    (filename,source,region,variable,month,yearstart)
+    """
+
+    ### Import modules
+    import glob
+    import os
+    import re
+
+    files = []
+    for filename in sorted(glob.glob(os.path.join(directory,'*.txt'))):
+        name = os.path.basename(filename)
+        atlas = re.match(r'Bering_SIE(85)?_iceatlas_(\d\d)_(\d{4})-(\d{4})' \
+                         r'\.txt$',name)
+        regional = re.match(r'BeringSeaIceExtent_NSIDC_regional_(\d\d)_' \
+                            r'(\d{4})-(\d{4})\.txt$',name)
+        monthly = re.match(r'BeringSeaIce_NSIDC_([A-Z][a-z]{2})\.txt$',name)
+        if atlas:
+            variable = 'extent85' if atlas.group(1) else 'extent'
+            files.append((filename,'atlas','bering',variable,
+                          int(atlas.group(2)),int(atlas.group(3))))
+        elif regional:
+            files.append((filename,'nsidc','bering','extent',
+                          int(regional.group(1)),int(regional.group(2))))
+        elif monthly and monthly.group(1) in monthnames:
+            files.append((filename,'nsidc','bering','extent',
+                          monthnames.index(monthly.group(1))+1,1979))
+    return files
+
+def _alignSeries(values,years,series):
+    """
+    Function finds the first year of a hand-exported series by matching it
+    against the workbook values of the same month (None if no match)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    n = values.shape[0]
+    for start in range(years[0]-n+1,years[-1]+1):
+        overlap = (years >= start) & (years < start+n)
+        if np.sum(overlap) < n//2:
+            continue
+        ref = series[overlap]
+        new = values[years[overlap]-start]
+        valid = np.isfinite(ref) & np.isfinite(new)
+        if np.any(valid) and np.all(np.abs(ref[valid]-new[valid]) < 1e-5):
+            return start
+    return None
+
+def buildStore(directory,filename=None):
+    """
+    Function builds the series store (only when a source file changed)
+
+    Parameters
+    ----------
+    directory : string
+        data directory with the monthly workbook and text series
+    filename : string, optional
+        path of the store (default is series_store.npz in directory)
+
+    Returns
+    -------
+    filename : string
+        path of the current store
+
+    Usage
+    -----
+    filename = buildStore(directory,filename)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import read_SeaIceIndex as RI
+
+    if filename is None:
+        filename = os.path.join(directory,'series_store.npz')
+
+    textfiles = _sourceFiles(directory)
+    inputs = [os.path.join(directory,workbook)] + [f[0] for f in textfiles]
+    inputs = [f for f in inputs if os.path.exists(f)]
+    key = ';'.join(['%s %s %s' % (os.path.basename(f),os.stat(f).st_size,
+                                  os.stat(f).st_mtime_ns) for f in inputs])
+
+    if os.path.exists(filename):
+        with np.load(filename) as store:
+            if str(store['key']) == key:
+                return filename
+
+    print('Building series store %s!' % filename)
+
+    ### Series as {(source,region,variable) : {year : [12 months]}}
+    series = {}
+    def insert(name,month,years,values):
+        table = series.setdefault(name,{})
+        for yr,value in zip(years,values):
+            if np.isfinite(value):
+                table.setdefault(int(yr),np.full((12),np.nan))[month-1] = value
+
+    ### Monthly workbook (all regions, extent and area)
+    if os.path.exists(os.path.join(directory,workbook)):
+        cachedir = RI.cacheIndex(os.path.join(directory,workbook))
+        for field in sorted(os.listdir(cachedir)):
+            if not field.endswith('.npy') or field.count('_') != 1 \
+                    or field == 'years.npy':
+                continue
+            region,variable = field[:-4].split('_')
+            years,data,rank = RI.readMonthly(os.path.join(directory,workbook),
+                                             region,variable)
+            for mo in range(12):
+                insert(('nsidc',region,variable),mo+1,years,data[:,mo]/1e6)
+
+    ### Text series (older files first so newer exports take precedence)
+    textfiles = sorted(textfiles,key=lambda f: os.path.basename(f[0]))
+    for textfile,source,region,variable,month,yearstart in textfiles:
+        if source == 'atlas':
+            values = np.genfromtxt(textfile,skip_header=1)
+            insert((source,region,variable),month,
+                   yearstart + np.arange(values.shape[0]),values)
+        else:
+            values = np.genfromtxt(textfile)/1e6
+            table = series.get((source,region,variable),{})
+            years = np.array(sorted(table),dtype=int)
+            start = None
+            if years.size > 0:
+                ref = np.array([table[yr][month-1] for yr in years])
+                start = _alignSeries(values,years,ref)
+            if start is None:
+                print('Skipping %s (does not match workbook)!' % textfile)
+                continue
+            insert((source,region,variable),month,
+                   start + np.arange(values.shape[0]),values)
+
+    ### Save each series as years [year] and values [year,month]
+    arrays = {'key' : np.array(key)}
+    for (source,region,variable),table in series.items():
+        years = np.array(sorted(table),dtype=int)
+        name = '%s/%s/%s' % (source,region,variable)
+        arrays[name + '/years'] = years
+        arrays[name + '/values'] = np.array([table[yr] for yr in years])
+    np.savez(filename,**arrays)
+
+    return filename
+
+def readStore(directory,filename=None):
+    """
+    Function opens the series store (building it when out of date)
+
+    Parameters
+    ----------
+    directory : string
+        data directory with the monthly workbook and text series
+    filename : string, optional
+        path of the store (default is series_store.npz in directory)
+
+    Returns
+    -------
+    store : SeriesStore
+        indexed series store
+
+    Usage
+    -----
+    store = readStore(directory,filename)
+    """
+
+    return SeriesStore(buildStore(directory,filename))
+
+class SeriesStore(object):
+    """
+    Indexed store of monthly series (10^6 km^2) keyed by source ('nsidc' or
+    'atlas'), region (e.g. 'bering'), variable ('extent', 'area' or
+    'extent85'), month (1-12) and year
+
+    Usage
+    -----
+    store = SeriesStore(filename)
+    keys = store.keys()
+    var = store.query(source,region,variable,months,years)
+    """
+
+    def __init__(self,filename):
+        import numpy as np
+
+        self.series = {}
+        with np.load(filename) as store:
+            for name in store.files:
+                if name.endswith('/years'):
+                    key = tuple(name.split('/')[:3])
+                    self.series[key] = (store[name],
+                                        store[name[:-6] + '/values'])
+
+    def keys(self):
+        return sorted(self.series)
+
+    def years(self,source,region,variable):
+        return self.series[(source,region.lower(),variable)][0]
+
+    def query(self,source,region,variable,months,years=None):
+        """
+        Returns the series for the given month (1d [year]) or months (2d
+        [year,month]), with nan for years that are not in the store
+        """
+        import numpy as np
+
+        key = (source,region.lower(),variable)
+        if key not in self.series:
+            raise ValueError('No series for %s, choose from %s' \
+                             % (key,self.keys()))
+        yearsq,values = self.series[key]
+        if years is None:
+            years = yearsq
+
+        ### Gather the requested years (missing years are nan)
+        years = np.asarray(years)
+        index = np.clip(np.searchsorted(yearsq,years),0,yearsq.shape[0]-1)
+        found = yearsq[index] == years
+        var = values[index][:,np.asarray(months)-1]
+        var[~found] = np.nan
+
+        return var
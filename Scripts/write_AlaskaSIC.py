@@ -0,0 +1,350 @@
+"""
+Functions write the monthly Alaska_SIC_<Mon>_1850-YYYY.nc products on the
+Alaska Sea Ice Atlas grid. The year dimension is unlimited, so an annual
+update appends one [lat,lon] slice in place instead of rewriting the file.
+With compact=True SIC is stored as uint8 percent with 255 as the fill value
+(see calc_CompactSIC).
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    findAlaska(directory,month)
+    writeAlaska(directory,month,years,var,lat1,lon1,compact)
+    buildAlaska(directory,yearmax,workers,compact,atlas)
+"""
+
+def findAlaska(directory,month):
+    """
+    Function finds the existing 1850-YYYY product for a calendar month
+
+    Parameters
+    ----------
+    directory : string
+        directory of the stored products
+    month : integer
+        calendar month (1-12)
+
+    Returns
+    -------
+    filename : string (or None)
+        product with the latest end year, None if there is no product
+
+    Usage
+    -----
+    filename = findAlaska(directory,month)
+    """
+
+    ### Import modules
+    import calendar as cal
+    import glob
+    import re
+
+    mon = cal.month_abbr[month]
+    pattern = re.compile(r'Alaska_SIC_%s_1850-(\d{4})\.nc$' % mon)
+
+    filenames = {}
+    for filename in glob.glob(directory + 'Alaska_SIC_%s_1850-*.nc' % mon):
+        match = pattern.search(filename)
+        if match is not None:
+            filenames[int(match.group(1))] = filename
+
+    if len(filenames) == 0:
+        return None
+    return filenames[max(filenames)]
+
+def writeAlaska(directory,month,years,var,lat1,lon1,compact=False):
+    """
+    Function creates or appends to the Alaska_SIC product for a calendar
+    month. Years already in the product are overwritten in place, new years
+    are appended and the file is renamed to its new end year.
+
+    Parameters
+    ----------
+    directory : string
+        directory of the stored products
+    month : integer
+        calendar month (1-12)
+    years : 1d array
+        years of var
+    var : 2d array [lat,lon] or 3d array [year,lat,lon]
+        sea ice concentration (%)
+    lat1 : 1d array
+        latitudes (only used when the product is created)
+    lon1 : 1d array
+        longitudes (only used when the product is created)
+    compact : boolean, optional
+        create the product with uint8 SIC (existing products keep their
+        type)
+
+    Returns
+    -------
+    filename : string
+        path of the updated product
+
+    Usage
+    -----
+    filename = writeAlaska(directory,month,years,var,lat1,lon1,compact)
+    """
+
+    print('\n>>> Using writeAlaska function!')
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+    import calendar as cal
+    import os
+    import calc_CompactSIC as CS
+
+    years = np.atleast_1d(years)
+    var = np.reshape(var,(years.shape[0],) + np.shape(var)[-2:])
+    mon = cal.month_abbr[month]
+
+    filename = findAlaska(directory,month)
+    if filename is None:
+        filename = directory + 'Alaska_SIC_%s_1850-%s.nc' % (mon,
+                                                             np.max(years))
+        ncfile = Dataset(filename,'w',format='NETCDF4')
+
+        ### Dimensions (unlimited years)
+        ncfile.createDimension('year',None)
+        ncfile.createDimension('lat',var.shape[1])
+        ncfile.createDimension('lon',var.shape[2])
+
+        ### Variables (one compressed chunk per year and 64x64 tile)
+        yearsn = ncfile.createVariable('years','i4',('year'))
+        latitude = ncfile.createVariable('lat','f4',('lat'))
+        longitude = ncfile.createVariable('lon','f4',('lon'))
+        chunks = (1,min(var.shape[1],64),min(var.shape[2],64))
+        if compact:
+            varns = ncfile.createVariable('sic','u1',('year','lat','lon'),
+                                          zlib=True,complevel=4,
+                                          chunksizes=chunks,
+                                          fill_value=CS.missing)
+        else:
+            varns = ncfile.createVariable('sic','f4',('year','lat','lon'),
+                                          zlib=True,complevel=4,shuffle=True,
+                                          chunksizes=chunks)
+
+        ### Units
+        varns.units = '%'
+        ncfile.title = 'SIC on AK Sea Ice Atlas Grid'
+        ncfile.instituion = 'Dept. ESS at University of California, Irvine'
+        ncfile.source = 'http://seaiceatlas.snap.uaf.edu/'
+        ncfile.references = 'see Atlas documentation for various sources'
+
+        latitude[:] = lat1
+        longitude[:] = lon1
+    else:
+        ncfile = Dataset(filename,'a')
+        if not ncfile.dimensions['year'].isunlimited():
+            ncfile.close()
+            raise ValueError('%s has a fixed year dimension, rebuild it ' \
+                             'with writeAlaska!' % filename)
+        yearsn = ncfile.variables['years']
+        varns = ncfile.variables['sic']
+
+    ### Compact products store uint8 percent
+    if varns.dtype == np.uint8:
+        var = CS.packSIC(var)
+
+    ### Write each year in place or append it to the end
+    stored = list(np.asarray(yearsn[:]))
+    for i in range(years.shape[0]):
+        if years[i] in stored:
+            index = stored.index(years[i])
+        else:
+            index = len(stored)
+            stored.append(years[i])
+        yearsn[index] = years[i]
+        varns[index,:,:] = var[i]
+
+    yearmax = np.max(stored)
+    ncfile.description = '%s 1850-%s SIC from ' \
+                         'Alaska Sea Ice Atlas' % (cal.month_name[month],
+                                                   yearmax)
+    ncfile.close()
+
+    ### Rename to the new end year
+    newname = directory + 'Alaska_SIC_%s_1850-%s.nc' % (mon,yearmax)
+    if newname != filename:
+        os.rename(filename,newname)
+        filename = newname
+
+    print('*Completed: Wrote %s year(s) to %s!' % (years.shape[0],
+                                                   os.path.basename(filename)))
+    return filename
+
+def _buildMonth(args):
+    """
+    Function rebuilds the product for one calendar month (used by workers)
+    in a temporary directory and moves it over the old product
+    """
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+    import calendar as cal
+    import os
+    import shutil
+    import tempfile
+
+    directory,month,years,ice,lat1,lon1,yearmax,compact = args
+    mon = cal.month_abbr[month]
+
+    ### Add the years after the atlas (OSISAF on the atlas grid)
+    yearsosi = []
+    iceosi = []
+    for yr in range(years[-1]+1,yearmax+1):
+        filename = directory + 'Alaska_SIC_%s_%s.nc' % (mon,yr)
+        if not os.path.exists(filename):
+            continue
+        data = Dataset(filename)
+        iceosi.append(data.variables['sic'][:])
+        data.close()
+        yearsosi.append(yr)
+    if len(iceosi) > 0:
+        years = np.append(years,yearsosi)
+        ice = np.ma.concatenate([ice,np.ma.stack(iceosi)],axis=0)
+
+    ### Old product is only replaced once the new one is written
+    product = findAlaska(directory,month)
+    tempdir = tempfile.mkdtemp(prefix='.Alaska_SIC_%s_' % mon,dir=directory)
+    try:
+        tempname = writeAlaska(tempdir + os.sep,month,years,ice,lat1,lon1,
+                               compact)
+        filename = directory + os.path.basename(tempname)
+        os.replace(tempname,filename)
+    finally:
+        shutil.rmtree(tempdir,ignore_errors=True)
+    if product is not None and os.path.abspath(product) != \
+            os.path.abspath(filename):
+        os.remove(product)
+
+    return filename
+
+def buildAlaska(directory,yearmax,workers=None,compact=False,atlas=None):
+    """
+    Function rebuilds the Alaska_SIC products for all 12 calendar months
+    from one read of the SNAP atlas, writing the months in parallel (one
+    worker per month), and creates a combined Alaska_SIC_1850-YYYY.nc file
+    of [year,month,lat,lon] from the per-month products
+
+    Parameters
+    ----------
+    directory : string
+        directory of the SNAP atlas file and products
+    yearmax : integer
+        last year of the OSISAF (Alaska_SIC_<Mon>_YYYY.nc) files to add
+    workers : integer, optional
+        number of worker processes (default is the number of cores)
+    compact : boolean, optional
+        store SIC as uint8 percent (see calc_CompactSIC)
+    atlas : string, optional
+        path of the SNAP atlas file (default is SNAP_SEA_ICE_ATLAS_MAR.nc
+        in directory, every atlas file holds all months)
+
+    Returns
+    -------
+    filename : string
+        path of the combined product
+
+    Usage
+    -----
+    filename = buildAlaska(directory,yearmax,workers,compact,atlas)
+    """
+
+    print('\n>>> Using buildAlaska function!')
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+    from concurrent.futures import ProcessPoolExecutor
+    import os
+    import read_SeaIceAtlas as RA
+    import calc_CompactSIC as CS
+
+    if atlas is None:
+        atlas = directory + 'SNAP_SEA_ICE_ATLAS_MAR.nc'
+
+    ### Read all months of the atlas once [year,month,lat,lon] (row 0 is
+    ### the year of the first time step, the first December is in it)
+    lat1,lon1,ice = RA.readAtlas(atlas,range(1,12+1))
+    year0 = RA.yearsAtlas(atlas,12)[0]
+
+    ### Write every month at once
+    args = []
+    for month in range(1,12+1):
+        yearsmo = RA.yearsAtlas(atlas,month)
+        rows = yearsmo - year0
+        args.append((directory,month,yearsmo,ice[rows,month-1],lat1,lon1,
+                     yearmax,compact))
+    del ice
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        products = list(pool.map(_buildMonth,args))
+    del args
+
+    ### Combined years (months missing in a year are masked)
+    yearsall = []
+    for product in products:
+        data = Dataset(product)
+        yearsall.append(data.variables['years'][:])
+        data.close()
+    years = np.unique(np.concatenate(yearsall))
+
+    filename = directory + 'Alaska_SIC_1850-%s.nc' % np.max(years)
+    tempname = directory + '.Alaska_SIC_1850-%s.nc.tmp' % np.max(years)
+    ncfile = Dataset(tempname,'w',format='NETCDF4')
+    ncfile.description = '1850-%s monthly SIC from ' \
+                         'Alaska Sea Ice Atlas' % np.max(years)
+
+    ### Dimensions
+    ncfile.createDimension('year',None)
+    ncfile.createDimension('month',12)
+    ncfile.createDimension('lat',lat1.shape[0])
+    ncfile.createDimension('lon',lon1.shape[0])
+
+    ### Variables
+    yearsn = ncfile.createVariable('years','i4',('year'))
+    monthsn = ncfile.createVariable('months','i4',('month'))
+    latitude = ncfile.createVariable('lat','f4',('lat'))
+    longitude = ncfile.createVariable('lon','f4',('lon'))
+    chunks = (1,1,min(lat1.shape[0],64),min(lon1.shape[0],64))
+    if compact:
+        varns = ncfile.createVariable('sic','u1',('year','month','lat','lon'),
+                                      zlib=True,complevel=4,chunksizes=chunks,
+                                      fill_value=CS.missing)
+    else:
+        varns = ncfile.createVariable('sic','f4',('year','month','lat','lon'),
+                                      zlib=True,complevel=4,shuffle=True,
+                                      chunksizes=chunks)
+
+    ### Units
+    varns.units = '%'
+    ncfile.title = 'SIC on AK Sea Ice Atlas Grid'
+    ncfile.instituion = 'Dept. ESS at University of California, Irvine'
+    ncfile.source = 'http://seaiceatlas.snap.uaf.edu/'
+    ncfile.references = 'see Atlas documentation for various sources'
+
+    ### Data (one month product in memory at a time)
+    yearsn[:] = years
+    monthsn[:] = np.arange(1,12+1,1)
+    latitude[:] = lat1
+    longitude[:] = lon1
+    for i in range(12):
+        data = Dataset(products[i])
+        yearsmo = data.variables['years'][:]
+        icemo = data.variables['sic'][:]
+        data.close()
+        if compact:
+            icemo = CS.packSIC(icemo)
+        varns[np.searchsorted(years,yearsmo),i,:,:] = icemo
+
+    ncfile.close()
+    os.replace(tempname,filename)
+    print('*Completed: Created netCDF4 File!')
+
+    return filename